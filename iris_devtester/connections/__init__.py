@@ -18,7 +18,7 @@ from iris_devtester.connections.manager import (
     get_connection as get_connection_legacy,
     get_connection_with_info,
 )
-from iris_devtester.connections import dbapi, jdbc
+from iris_devtester.connections import dbapi, jdbc, pool
 
 # Utilities
 from iris_devtester.connections.auto_discovery import (
@@ -40,6 +40,7 @@ __all__ = [
     "get_connection_with_info",
     "dbapi",
     "jdbc",
+    "pool",
     # Utilities
     "auto_detect_iris_port",
     "auto_detect_iris_host_and_port",
@@ -0,0 +1,181 @@
+"""
+Process-wide connection pool for IRIS DBAPI connections.
+
+Every get_connection() call pays a TCP handshake plus IRIS authentication
+(50-200ms). Test fixtures that open a connection per test — or per
+parametrization — repay that cost constantly. This pool keeps idle
+connections keyed by (host, port, namespace, username) and hands them
+back out after a cheap liveness check, the same keepalive pattern HTTP
+clients use for sockets.
+
+Example:
+    >>> from iris_devtester.connections import pool
+    >>> conn = pool.acquire(config)
+    >>> try:
+    ...     cursor = conn.cursor()
+    ...     cursor.execute("SELECT 1")
+    ... finally:
+    ...     pool.release(conn)
+
+Constitutional Principle #2: DBAPI First (pooled connections come from
+the modern DBAPI-only path).
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from iris_devtester.config import IRISConfig
+from iris_devtester.connections.connection import get_connection
+
+logger = logging.getLogger(__name__)
+
+# Idle connections per (host, port, namespace, username) key. LIFO so the
+# most recently used (most likely still alive) connection goes out first.
+_MAX_IDLE_PER_KEY = 16
+
+_pools: Dict[Tuple[Any, Any, Any, Any], "queue.LifoQueue"] = {}
+_pools_lock = threading.Lock()
+
+# Reverse map so release() knows which pool a connection belongs to.
+_conn_keys: Dict[int, Tuple[Any, Any, Any, Any]] = {}
+
+
+def _pool_key(config: IRISConfig) -> Tuple[Any, Any, Any, Any]:
+    """Pool key for a config: one pool per distinct connection target."""
+    return (config.host, config.port, config.namespace, config.username)
+
+
+def _get_pool(key: Tuple[Any, Any, Any, Any]) -> "queue.LifoQueue":
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=_MAX_IDLE_PER_KEY)
+            _pools[key] = pool
+        return pool
+
+
+def _ping(conn: Any) -> bool:
+    """Cheap liveness check before handing out a pooled connection."""
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        finally:
+            cursor.close()
+        return True
+    except Exception:
+        return False
+
+
+def acquire(config: Optional[IRISConfig] = None) -> Any:
+    """
+    Get a connection for config, reusing an idle pooled one if alive.
+
+    Pooled connections are pinged with SELECT 1 before being handed out;
+    dead sockets are discarded and a fresh connection is opened instead.
+
+    Args:
+        config: IRIS configuration (None auto-discovers, like
+                get_connection)
+
+    Returns:
+        DBAPI connection object
+
+    Raises:
+        ConnectionError: If a fresh connection cannot be established
+    """
+    if config is not None:
+        pool = _get_pool(_pool_key(config))
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            if _ping(conn):
+                return conn
+            # Drop the dead connection's key entry before discarding it:
+            # id() values are reused after garbage collection, so a stale
+            # entry could later misroute an unrelated connection's
+            # release() into this pool bucket.
+            _conn_keys.pop(id(conn), None)
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    conn = get_connection(config)
+    if config is not None:
+        _conn_keys[id(conn)] = _pool_key(config)
+    return conn
+
+
+def release(conn: Any) -> None:
+    """
+    Return a connection to its pool instead of closing it.
+
+    Connections acquired without a config (auto-discovered), or returned
+    to a full pool, are closed.
+
+    Args:
+        conn: Connection previously returned by acquire()
+    """
+    key = _conn_keys.get(id(conn))
+    if key is not None:
+        try:
+            _get_pool(key).put_nowait(conn)
+            return
+        except queue.Full:
+            pass
+    _conn_keys.pop(id(conn), None)
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def evict_for_host(host: Any, port: Any) -> None:
+    """
+    Close and drop all idle connections to a host:port.
+
+    Call on container teardown so the pool never hands out a socket to a
+    container that no longer exists.
+
+    Args:
+        host: Host whose connections to evict
+        port: Port whose connections to evict
+    """
+    with _pools_lock:
+        keys = [k for k in _pools if k[0] == host and k[1] == port]
+        pools = [_pools.pop(k) for k in keys]
+    for pool in pools:
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            _conn_keys.pop(id(conn), None)
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+def clear() -> None:
+    """Close and drop every idle pooled connection (test teardown hook)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        while True:
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                break
+            _conn_keys.pop(id(conn), None)
+            try:
+                conn.close()
+            except Exception:
+                pass
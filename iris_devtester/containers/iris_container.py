@@ -598,48 +598,120 @@ class IRISContainer(BaseIRISContainer):
         if self._connection is not None:
             return self._connection
 
-        # CRITICAL: Enable CallIn service for DBAPI connections
-        # This is required for embedded Python and DBAPI to work
-        # (Constitutional Principle #1: Automatic Remediation)
-        if enable_callin and not self._callin_enabled:
-            logger.info("Enabling CallIn service for DBAPI connections...")
-            if self.enable_callin_service():
-                logger.info("✓ CallIn service enabled")
+        container_name = self.get_container_name()
+        config = self.get_config()
+
+        # The warmup steps are independent docker-exec/network operations
+        # that each wait on IRIS readiness; running them concurrently
+        # bounds warmup by the slowest step instead of their sum.
+        # (CallIn touches Security.Services; the user-hardening chain
+        # touches Security.Users and stays serialized within its worker.
+        # The credential probe inside _warm_users needs CallIn, so it
+        # waits on the CallIn future rather than racing it.)
+
+        def _warm_callin() -> None:
+            # CRITICAL: Enable CallIn service for DBAPI connections
+            # This is required for embedded Python and DBAPI to work
+            # (Constitutional Principle #1: Automatic Remediation)
+            if enable_callin and not self._callin_enabled:
+                logger.info("Enabling CallIn service for DBAPI connections...")
+                if self.enable_callin_service():
+                    logger.info("✓ CallIn service enabled")
+                else:
+                    logger.warning(
+                        "⚠️  Could not enable CallIn service. "
+                        "DBAPI connections may fail. Will fall back to JDBC."
+                    )
+
+        def _warm_users(callin_done) -> None:
+            # CRITICAL: Unexpire passwords to prevent "password change required"
+            # errors, then PROACTIVELY reset the password BEFORE the first
+            # connection attempt (Feature 007 fix - Constitutional Principle #1)
+            from iris_devtester.utils.unexpire_passwords import unexpire_all_passwords
+            from iris_devtester.utils.password_reset import reset_password
+            from iris_devtester.utils.password_verification import (
+                verify_password_via_connection,
+            )
+
+            success, msg = unexpire_all_passwords(container_name)
+            if success:
+                logger.info(f"✓ Passwords unexpired: {msg}")
+            else:
+                logger.warning(f"⚠️  Could not unexpire passwords: {msg}")
+
+            # Fast path: if the expected credentials already authenticate
+            # (the common case for Community, where testcontainers-iris
+            # creates the user with the right password), skip the docker
+            # exec + verification loop entirely — one cheap connect probe
+            # instead of a multi-second reset. The probe connects over
+            # DBAPI, which needs CallIn: wait for that enablement to
+            # finish first, or the probe's outcome (and whether the
+            # expensive reset runs) would depend on a race.
+            try:
+                callin_done.result()
+            except Exception:
+                pass  # _warm_callin logs its own failures
+            probe = verify_password_via_connection(
+                hostname=config.host,
+                port=config.port,
+                namespace=config.namespace,
+                username=config.username,
+                password=config.password,
+                attempt_number=1,
+            )
+            if probe.success:
+                logger.info(
+                    "✓ Credentials already valid; skipping proactive password reset"
+                )
+                return
+
+            logger.info("Proactively resetting password to ensure clean connection...")
+            reset_success, reset_msg = reset_password(
+                container_name=container_name,
+                username=config.username,
+                new_password=config.password,
+                hostname=config.host,
+                port=config.port,
+                namespace=config.namespace,
+            )
+            if reset_success:
+                logger.info(f"✓ Password proactively reset: {reset_msg}")
             else:
                 logger.warning(
-                    "⚠️  Could not enable CallIn service. "
-                    "DBAPI connections may fail. Will fall back to JDBC."
+                    f"⚠️  Password reset failed (will attempt connection anyway): {reset_msg}"
                 )
 
-        # CRITICAL: Unexpire passwords to prevent "password change required" errors
-        # (Constitutional Principle #1: Automatic Remediation)
-        from iris_devtester.utils.unexpire_passwords import unexpire_all_passwords
-        container_name = self.get_container_name()
-        success, msg = unexpire_all_passwords(container_name)
-        if success:
-            logger.info(f"✓ Passwords unexpired: {msg}")
-        else:
-            logger.warning(f"⚠️  Could not unexpire passwords: {msg}")
+        def _warm_port() -> None:
+            # TCP probe with short backoff: confirms the superserver port
+            # accepts connections so the DBAPI connect below doesn't eat
+            # its own connect timeout on a not-yet-listening socket.
+            import socket
+            import time
 
-        # CRITICAL: PROACTIVELY reset password BEFORE first connection attempt
-        # (Feature 007 fix - Constitutional Principle #1: Automatic Remediation)
-        # This prevents "Access Denied" and "Password change required" errors
-        from iris_devtester.utils.password_reset import reset_password
-        config = self.get_config()
+            deadline = time.time() + 30
+            while time.time() < deadline:
+                try:
+                    socket.create_connection(
+                        (config.host, config.port), timeout=1
+                    ).close()
+                    return
+                except OSError:
+                    time.sleep(0.2)
+            logger.warning(
+                f"⚠️  Port {config.host}:{config.port} not accepting connections yet"
+            )
 
-        logger.info("Proactively resetting password to ensure clean connection...")
-        reset_success, reset_msg = reset_password(
-            container_name=container_name,
-            username=config.username,
-            new_password=config.password,
-            hostname=config.host,
-            port=config.port,
-            namespace=config.namespace,
-        )
-        if reset_success:
-            logger.info(f"✓ Password proactively reset: {reset_msg}")
-        else:
-            logger.warning(f"⚠️  Password reset failed (will attempt connection anyway): {reset_msg}")
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            callin_future = pool.submit(_warm_callin)
+            warmup = [
+                callin_future,
+                pool.submit(_warm_users, callin_future),
+                pool.submit(_warm_port),
+            ]
+            for future in warmup:
+                future.result()
 
         # Use connection manager (DBAPI-first, JDBC-fallback)
         self._connection = get_connection(config)
@@ -1274,7 +1346,7 @@ Halt"""
         finally:
             conn.close()
 
-    def get_test_namespace(self, prefix: str = "TEST") -> str:
+    def get_test_namespace(self, prefix: str = "TEST", seed: Optional[str] = None) -> str:
         """
         Create unique test namespace for isolated testing.
 
@@ -1283,6 +1355,11 @@ Halt"""
 
         Args:
             prefix: Namespace prefix (default: "TEST")
+            seed: Optional stable identifier (e.g., a pytest nodeid). When
+                 given, the namespace name is derived from a short blake2b
+                 hash of the seed instead of a random UUID — same seed,
+                 same name, no string-munging of long nodeids and no
+                 truncation collisions.
 
         Returns:
             Namespace name (e.g., "TEST_A1B2C3D4")
@@ -1317,9 +1394,26 @@ Halt"""
             See docs/SQL_VS_OBJECTSCRIPT.md for the pattern of using
             iris.connect() for setup/cleanup and DBAPI for testing.
         """
-        import uuid
+        import os
+
+        # Under pytest-xdist, fold the worker id into the name so workers
+        # sharing one container (e.g. an attached/keepalive container)
+        # carve out disjoint namespaces — and `docker exec` inspection
+        # maps a namespace straight back to its worker.
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+        if worker_id:
+            prefix = f"{prefix}_{worker_id.upper()}"
+
+        if seed is not None:
+            import hashlib
+
+            suffix = hashlib.blake2b(seed.encode(), digest_size=6).hexdigest().upper()
+        else:
+            import uuid
+
+            suffix = uuid.uuid4().hex[:8].upper()
 
-        namespace = f"{prefix}_{uuid.uuid4().hex[:8].upper()}"
+        namespace = f"{prefix}_{suffix}"
 
         if self.create_namespace(namespace):
             logger.debug(f"Created test namespace: {namespace}")
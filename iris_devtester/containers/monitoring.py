@@ -11,7 +11,7 @@ Monitoring is configured to run continuously by default (30-second intervals,
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from typing import ClassVar, Optional, Tuple
 
 __all__ = [
     "CollectionInterval",
@@ -28,11 +28,16 @@ __all__ = [
     "suspend_task",
     "resume_task",
     "delete_task",
+    "delete_tasks",
     "list_monitoring_tasks",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Shared by delete_task()/delete_tasks() so repeated deletes hit the same
+# entry in the IRIS statement cache instead of recompiling per call.
+_DELETE_TASK_SQL = "DELETE FROM %SYS.Task WHERE ID = ?"
+
 
 class CollectionInterval(Enum):
     """Predefined collection intervals with validation."""
@@ -296,6 +301,29 @@ class ResourceThresholds:
     # Monitoring frequency
     check_interval_seconds: int = 60  # Check every 60 seconds
 
+    # Shared pre-validated defaults instance (see default())
+    _default: ClassVar[Optional["ResourceThresholds"]] = None
+
+    @classmethod
+    def default(cls) -> "ResourceThresholds":
+        """
+        Return a shared, pre-validated instance with default thresholds.
+
+        The defaults never change at runtime, so one validate() pass
+        covers every caller; repeat calls return the cached instance
+        instead of re-running construction plus range checks. Treat the
+        returned instance as read-only — construct your own
+        ResourceThresholds(...) to customize values.
+
+        Returns:
+            Cached ResourceThresholds with default values
+        """
+        if cls._default is None:
+            instance = cls()
+            instance.validate()
+            cls._default = instance
+        return cls._default
+
     def validate(self) -> None:
         """
         Validate threshold configuration.
@@ -1096,10 +1124,7 @@ def delete_task(conn, task_id: str) -> bool:
 
         # Use SQL DELETE (works with DBAPI!)
         cursor = conn.cursor()
-        cursor.execute(
-            "DELETE FROM %SYS.Task WHERE ID = ?",
-            (task_id,)
-        )
+        cursor.execute(_DELETE_TASK_SQL, (task_id,))
         conn.commit()
 
         # Check if anything was deleted
@@ -1140,6 +1165,61 @@ def delete_task(conn, task_id: str) -> bool:
         raise RuntimeError(error_msg) from e
 
 
+def delete_tasks(conn, task_ids: list) -> int:
+    """
+    Delete multiple Task Manager tasks in one statement batch.
+
+    One executemany plus a single commit instead of a DELETE + commit
+    (each a journal flush) per task — lets IRIS reuse the prepared
+    statement and collapses N round-trips of cleanup into one batch.
+
+    Args:
+        conn: Database connection
+        task_ids: Task IDs to delete
+
+    Returns:
+        Number of tasks passed in (0 if the list was empty)
+
+    Raises:
+        RuntimeError: If deletion fails
+
+    Example:
+        >>> ids = [create_task(conn, TaskSchedule(name=f"t-{i}")) for i in range(3)]
+        >>> delete_tasks(conn, ids)
+        3
+    """
+    if not task_ids:
+        return 0
+
+    try:
+        logger.debug(f"Deleting {len(task_ids)} tasks in one batch")
+
+        cursor = conn.cursor()
+        cursor.executemany(
+            _DELETE_TASK_SQL,
+            [(task_id,) for task_id in task_ids],
+        )
+        conn.commit()
+
+        logger.info(f"✓ Deleted {len(task_ids)} tasks")
+        return len(task_ids)
+
+    except Exception as e:
+        error_msg = (
+            f"Failed to batch-delete {len(task_ids)} tasks: {e}\n"
+            "\n"
+            "What went wrong:\n"
+            f"  {type(e).__name__}: {e}\n"
+            "\n"
+            "How to fix it:\n"
+            "  1. Verify the task IDs exist\n"
+            "  2. Check user has Task Manager permissions\n"
+            "  3. Delete individually with delete_task() to find the culprit\n"
+        )
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from e
+
+
 def list_monitoring_tasks(conn) -> list:
     """
     List all iris-devtools monitoring tasks.
@@ -67,7 +67,7 @@ from .manifest import (
 
 # Import validator, loader, and creator
 from .validator import FixtureValidator
-from .loader import DATFixtureLoader
+from .loader import DATFixtureLoader, get_shared_loader
 from .creator import FixtureCreator
 
 # Import $SYSTEM.OBJ export/import utilities
@@ -98,6 +98,7 @@ __all__ = [
     # Classes
     "FixtureValidator",
     "DATFixtureLoader",
+    "get_shared_loader",
     "FixtureCreator",
     # $SYSTEM.OBJ utilities (Feature 017)
     "ExportResult",
@@ -4,9 +4,13 @@ This module provides the FixtureCreator class for creating IRIS database
 fixtures by exporting namespaces using BACKUP^DBACK routine.
 """
 
-import datetime
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Any, List, Dict
+from typing import Iterator, Optional, Any, List, Dict
 
 from iris_devtester.connections import get_connection
 from iris_devtester.config import IRISConfig
@@ -16,7 +20,31 @@ from .manifest import (
     TableInfo,
     FixtureCreateError,
 )
-from .validator import FixtureValidator
+
+# datetime, hashlib and FixtureValidator are imported lazily where used —
+# they're only needed once a fixture operation actually runs, and keeping
+# them out of module import speeds up short-lived CLI commands.
+
+# IRIS namespace names: letters, digits, dashes and underscores. Anything
+# else would break out of the quoted ObjectScript/SQL argument position and
+# defeat statement-cache reuse (or worse, inject code).
+_VALID_NAMESPACE_RE = re.compile(r"^[A-Za-z0-9_%-]+$")
+
+
+def _validate_namespace_name(namespace: str) -> str:
+    """Validate a namespace name before interpolating it into a command."""
+    if not namespace or not _VALID_NAMESPACE_RE.match(namespace):
+        raise FixtureCreateError(
+            f"Invalid namespace name: {namespace!r}\n"
+            "\n"
+            "What went wrong:\n"
+            "  Namespace names may only contain letters, digits, '%', '_' and '-'.\n"
+            "\n"
+            "How to fix it:\n"
+            "  1. Check the namespace name for typos or stray quotes\n"
+            "  2. List valid namespaces: do $SYSTEM.OBJ.ListNamespaces()\n"
+        )
+    return namespace
 
 
 class FixtureCreator:
@@ -71,8 +99,26 @@ class FixtureCreator:
         """
         self.connection_config = connection_config
         self.container = container
-        self.validator = FixtureValidator()
+        self._validator: Optional[Any] = None
         self._connection: Optional[Any] = None
+        self._cursor: Optional[Any] = None
+        self._iris_version: Optional[str] = None
+        # Checksums computed concurrently with the export copy, keyed by
+        # resolved .DAT path. Consumed (popped) by calculate_checksum so the
+        # file never has to be re-read from disk.
+        self._streamed_checksums: Dict[str, str] = {}
+        # One connection per target namespace, shared by the table listing
+        # and catalog-signature queries within a fixture operation.
+        self._ns_connections: Dict[str, Any] = {}
+
+    @property
+    def validator(self) -> Any:
+        """FixtureValidator, constructed on first use."""
+        if self._validator is None:
+            from .validator import FixtureValidator
+
+            self._validator = FixtureValidator()
+        return self._validator
 
     def create_fixture(
         self,
@@ -120,6 +166,19 @@ class FixtureCreator:
         """
         output_path = Path(output_dir)
 
+        # Fast-fail before any directory or export work
+        if not self.namespace_exists(namespace):
+            raise FixtureCreateError(
+                f"Namespace does not exist: {namespace}\n"
+                "\n"
+                "What went wrong:\n"
+                "  The source namespace was not found on the IRIS server.\n"
+                "\n"
+                "How to fix it:\n"
+                "  1. Check the namespace name for typos\n"
+                "  2. List namespaces: do $SYSTEM.OBJ.ListNamespaces()\n"
+            )
+
         # Check if output directory already exists
         if output_path.exists():
             raise FileExistsError(
@@ -151,23 +210,36 @@ class FixtureCreator:
                 "  3. Check disk space: df -h\n"
             )
 
-        # Export namespace to IRIS.DAT
+        # Export namespace to IRIS.DAT in the background while gathering
+        # metadata — the backup runs via docker exec and doesn't hold the
+        # database connection, so version/table queries overlap the (often
+        # minutes-long) backup instead of serializing behind it.
+        from concurrent.futures import ThreadPoolExecutor
+
         dat_file_path = output_path / "IRIS.DAT"
-        try:
-            self.export_namespace_to_dat(namespace, str(dat_file_path))
-        except Exception as e:
-            # Cleanup on failure
-            try:
-                output_path.rmdir()
-            except:
-                pass
-            raise
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            export_future = pool.submit(
+                self.export_namespace_to_dat, namespace, str(dat_file_path)
+            )
 
-        # Get IRIS version
-        iris_version = self._get_iris_version()
+            # Metadata queries that don't depend on backup completion
+            try:
+                iris_version = self._get_iris_version()
+                tables = self.get_namespace_tables(namespace)
+                tables_signature = self._get_tables_signature(namespace)
+            except Exception:
+                export_future.cancel()
+                raise
 
-        # Get table list with row counts
-        tables = self.get_namespace_tables(namespace)
+            try:
+                export_future.result()
+            except Exception:
+                # Cleanup on failure
+                try:
+                    output_path.rmdir()
+                except:
+                    pass
+                raise
 
         # Calculate checksum
         checksum = self.calculate_checksum(str(dat_file_path))
@@ -178,13 +250,14 @@ class FixtureCreator:
             version=version,
             schema_version="1.0",
             description=description,
-            created_at=datetime.datetime.utcnow().isoformat() + "Z",
+            created_at=self._utc_timestamp(),
             iris_version=iris_version,
             namespace=namespace,
             dat_file="IRIS.DAT",
             checksum=checksum,
             tables=tables,
             features=features,
+            tables_signature=tables_signature,
         )
 
         # Save manifest
@@ -233,6 +306,8 @@ class FixtureCreator:
                 "         creator = FixtureCreator(container=container)\n"
             )
 
+        _validate_namespace_name(namespace)
+
         try:
             import subprocess
 
@@ -246,12 +321,7 @@ class FixtureCreator:
             # This is essentially an "external backup" approach
             # Get namespace configuration to find database directory
             # Use single-line commands to avoid ObjectScript block syntax issues
-            objectscript_commands = f"""Do ##class(Config.Namespaces).Get("{namespace}",.nsProps)
-Set dbName = $Get(nsProps("Globals"))
-If dbName="" Write "ERROR_NO_NAMESPACE" Halt
-Do ##class(Config.Databases).Get(dbName,.dbProps)
-Write dbProps("Directory")
-Halt"""
+            objectscript_commands = self._GET_DB_DIR_SCRIPT.format(namespace=namespace)
 
             cmd = [
                 "docker",
@@ -342,17 +412,43 @@ Halt"""
                         "  3. Check disk space in container\n"
                     )
 
-                # Copy file from container to host
+                # Copy file from container to a staging path, hashing bytes
+                # as they land so calculate_checksum doesn't re-read a
+                # multi-GB file. Staging + rename means a failed copy never
+                # leaves a truncated IRIS.DAT at the final path.
+                staging_path = f"{dat_file_path}.partial"
                 cp_cmd = [
                     "docker",
                     "cp",
                     f"{container_name}:{container_path}",
-                    str(dat_file_path)
+                    staging_path
                 ]
 
-                cp_result = subprocess.run(
-                    cp_cmd, capture_output=True, text=True, timeout=30
+                copy_done = threading.Event()
+                hash_result: Dict[str, Any] = {}
+                hash_thread = threading.Thread(
+                    target=self._follow_and_hash,
+                    args=(staging_path, copy_done, hash_result),
+                    daemon=True,
                 )
+                hash_thread.start()
+
+                try:
+                    cp_result = subprocess.run(
+                        cp_cmd, capture_output=True, text=True, timeout=30
+                    )
+                finally:
+                    copy_done.set()
+                hash_thread.join(timeout=30)
+
+                if cp_result.returncode == 0 and Path(staging_path).exists():
+                    self._relocate_file(staging_path, str(dat_file_path))
+                else:
+                    # Don't leave partial staging files behind.
+                    try:
+                        Path(staging_path).unlink()
+                    except OSError:
+                        pass
 
                 if cp_result.returncode != 0:
                     raise FixtureCreateError(
@@ -361,6 +457,18 @@ Halt"""
                         f"stderr: {cp_result.stderr}\n"
                     )
 
+                # Only trust the streamed digest if the follower hashed
+                # exactly the bytes that ended up on disk.
+                if (
+                    "digest" in hash_result
+                    and Path(dat_file_path).exists()
+                    and hash_result.get("bytes_hashed")
+                    == Path(dat_file_path).stat().st_size
+                ):
+                    self._streamed_checksums[
+                        str(Path(dat_file_path).resolve())
+                    ] = f"sha256:{hash_result['digest']}"
+
                 # Verify file was copied
                 if not Path(dat_file_path).exists():
                     raise FixtureCreateError(
@@ -435,15 +543,90 @@ Halt"""
                 "  3. Try listing namespaces: do $SYSTEM.OBJ.ListNamespaces()\n"
             )
 
-    def calculate_checksum(self, dat_file_path: str) -> str:
+    # 1 MiB chunks: large enough to be I/O-bound, small enough to keep RSS flat.
+    _CHECKSUM_CHUNK_SIZE = 1 << 20
+
+    # ObjectScript for resolving a namespace's database directory, built
+    # once at class-construction time. Only the (validated) namespace is
+    # substituted per call, so the command text stays byte-identical across
+    # fixtures of the same namespace.
+    _GET_DB_DIR_SCRIPT = """Do ##class(Config.Namespaces).Get("{namespace}",.nsProps)
+Set dbName = $Get(nsProps("Globals"))
+If dbName="" Write "ERROR_NO_NAMESPACE" Halt
+Do ##class(Config.Databases).Get(dbName,.dbProps)
+Write dbProps("Directory")
+Halt"""
+
+    def _follow_and_hash(
+        self, dat_file_path: str, done: threading.Event, result: Dict[str, Any]
+    ) -> None:
+        """
+        Tail-follow a file being written and hash bytes as they appear.
+
+        Runs in a background thread while `docker cp` streams the .DAT to
+        the host. On EOF, waits briefly for more data until `done` is set,
+        then drains any remaining bytes and finalizes the digest. Records
+        `digest` and `bytes_hashed` in `result` for the caller to verify.
+        """
+        import hashlib
+
+        sha256_hash = hashlib.sha256()
+        bytes_hashed = 0
+        f = None
+        try:
+            # Wait for docker cp to create the file.
+            while f is None:
+                try:
+                    f = open(dat_file_path, "rb", buffering=0)
+                except FileNotFoundError:
+                    if done.is_set():
+                        return
+                    time.sleep(0.05)
+
+            while True:
+                chunk = f.read(self._CHECKSUM_CHUNK_SIZE)
+                if chunk:
+                    sha256_hash.update(chunk)
+                    bytes_hashed += len(chunk)
+                elif done.is_set():
+                    break
+                else:
+                    time.sleep(0.05)
+
+            result["digest"] = sha256_hash.hexdigest()
+            result["bytes_hashed"] = bytes_hashed
+        except OSError:
+            # Fall back to the normal re-read path in calculate_checksum.
+            pass
+        finally:
+            if f is not None:
+                f.close()
+
+    def calculate_checksum(
+        self, dat_file_path: str, parallel: bool = False, algo: str = "sha256"
+    ) -> str:
         """
         Calculate SHA256 checksum for .DAT file.
 
+        Streams the file in fixed-size chunks so multi-GB .DAT files never
+        get slurped into memory. On Python 3.11+ uses hashlib.file_digest
+        (zero-copy into the hash object); on Linux, advises the kernel to
+        read ahead sequentially and evict pages aggressively.
+
+        With parallel=True, computes a multi-threaded SHA256 tree-hash
+        instead (format "sha256tree:..."), which scales across cores for
+        very large files; validators understand both formats.
+
         Args:
             dat_file_path: Path to .DAT file
+            parallel: Use parallel tree-hashing (default: False)
+            algo: Hash algorithm — "sha256" (default) or "blake3", which
+                 is much faster on hosts without SHA-NI but requires the
+                 optional blake3 package
 
         Returns:
-            SHA256 checksum (format: "sha256:abc123...")
+            Checksum (format: "sha256:abc123...", "sha256tree:..." or
+            "blake3:...")
 
         Raises:
             FileNotFoundError: If .DAT file doesn't exist
@@ -453,14 +636,198 @@ Halt"""
             >>> checksum = creator.calculate_checksum("./fixtures/test/IRIS.DAT")
             >>> print(f"Checksum: {checksum}")
         """
-        return self.validator.calculate_sha256(dat_file_path)
+        import hashlib
+
+        if not Path(dat_file_path).exists():
+            raise FileNotFoundError(f"File not found: {dat_file_path}")
+
+        if algo == "blake3":
+            return self.validator.calculate_blake3(dat_file_path)
+        if algo != "sha256":
+            raise ValueError(f"Unsupported checksum algorithm: {algo!r}")
+
+        if parallel:
+            return self.validator.calculate_sha256_tree(dat_file_path)
+
+        # Reuse a digest computed concurrently with the export copy, if any.
+        cached = self._streamed_checksums.pop(
+            str(Path(dat_file_path).resolve()), None
+        )
+        if cached is not None:
+            return cached
+
+        with open(dat_file_path, "rb", buffering=0) as f:
+            # Hint sequential access so the page cache prefetches ahead of us
+            # and doesn't retain the whole .DAT afterwards (Linux only).
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                sha256_hash = hashlib.sha256()
+                for chunk in iter(lambda: f.read(self._CHECKSUM_CHUNK_SIZE), b""):
+                    sha256_hash.update(chunk)
+                digest = sha256_hash.hexdigest()
+
+        return f"sha256:{digest}"
+
+    def namespace_exists(self, namespace: str) -> bool:
+        """
+        Fast existence probe for a namespace.
+
+        Uses `SELECT 1 ... FETCH FIRST 1 ROW ONLY` rather than COUNT(*),
+        so IRIS stops at the first hit instead of aggregating, and the
+        parameterized form hits the statement-plan cache. Best-effort: if
+        the catalog can't be queried (no connection, restricted SQL
+        access), returns True and lets the export surface the real error.
+
+        Args:
+            namespace: Namespace name to check
+
+        Returns:
+            True if the namespace exists (or existence can't be determined)
+        """
+        try:
+            with self._scoped_cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM SYS.Namespace WHERE Name = ? "
+                    "FETCH FIRST 1 ROW ONLY",
+                    (namespace.upper(),),
+                )
+                return cursor.fetchone() is not None
+        except Exception:
+            return True
+
+    def _get_tables_signature(self, namespace: str) -> Optional[str]:
+        """
+        Cheap hash of the namespace's catalog state (schema, table, extent).
 
-    def get_namespace_tables(self, namespace: str) -> List[TableInfo]:
+        One metadata query — O(tables in catalog), not O(rows). Used by
+        refresh_fixture to detect whether the table list actually changed
+        since the last export. Returns None if the catalog can't be read
+        (e.g. older IRIS without EXTENTSIZE).
+        """
+        import hashlib
+
+        try:
+            conn = self._namespace_connection(namespace)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT TABLE_SCHEMA, TABLE_NAME, EXTENTSIZE
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_TYPE = 'BASE TABLE'
+                ORDER BY TABLE_SCHEMA, TABLE_NAME
+                """
+            )
+            entries = sorted(
+                (str(row[0]), str(row[1]), str(row[2])) for row in cursor.fetchall()
+            )
+            cursor.close()
+            return hashlib.sha256(repr(entries).encode()).hexdigest()
+        except Exception:
+            return None
+
+    def _namespace_connection(self, namespace: str) -> Any:
+        """
+        Get a connection targeting the given namespace.
+
+        Cached per namespace on the instance — within one create/refresh
+        the table listing and catalog-signature queries would otherwise
+        each pay a full connection handshake to the same namespace.
+        """
+        conn = self._ns_connections.get(namespace)
+        if conn is not None:
+            return conn
+
+        import dataclasses
+        from iris_devtester.config import discover_config
+
+        config = self.connection_config if self.connection_config else discover_config()
+        conn = get_connection(dataclasses.replace(config, namespace=namespace))
+        self._ns_connections[namespace] = conn
+        return conn
+
+    def close(self) -> None:
+        """Close any connections held by this creator."""
+        for conn in self._ns_connections.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._ns_connections.clear()
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+    @staticmethod
+    def _relocate_file(src: str, dst: str) -> None:
+        """
+        Move a file into place without user-space byte copies.
+
+        os.replace is a zero-copy rename on the same filesystem. Across
+        filesystems, shutil.copyfile engages the kernel's
+        sendfile/copy_file_range fast path (Python 3.8+), so multi-GB .DAT
+        files never pass through Python buffers; copyfile is preferred
+        over shutil.move because the staging file needs no metadata
+        preservation, skipping move's copystat pass.
+        """
+        try:
+            os.replace(src, dst)
+        except OSError:
+            import shutil
+
+            shutil.copyfile(src, dst)
+            os.unlink(src)
+
+    @staticmethod
+    def _utc_timestamp() -> str:
+        """
+        Current UTC time as an ISO-8601 "Z" string.
+
+        Uses timezone-aware now() (utcnow() is deprecated in Py3.12+) and
+        is computed once per fixture operation rather than per field.
+        """
+        import datetime
+
+        return (
+            datetime.datetime.now(datetime.timezone.utc)
+            .isoformat(timespec="seconds")
+            .replace("+00:00", "Z")
+        )
+
+    @staticmethod
+    def _iter_rows(cursor: Any) -> Iterator[Any]:
+        """Yield rows page by page via fetchmany instead of fetchall."""
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield row
+
+    def get_namespace_tables(
+        self, namespace: str, exact_counts: bool = False
+    ) -> List[TableInfo]:
         """
         Get list of tables in namespace with row counts.
 
+        By default reads IRIS's stored extent-size estimates from the
+        catalog — one metadata query instead of a full `SELECT COUNT(*)`
+        scan per table, which dominates fixture creation on populated
+        namespaces. Pass exact_counts=True to scan each table instead.
+
         Args:
             namespace: Namespace to inspect
+            exact_counts: Run COUNT(*) per table instead of catalog
+                         estimates (default: False, much slower)
 
         Returns:
             List of TableInfo objects with names and row counts
@@ -475,19 +842,45 @@ Halt"""
             ...     print(f"{table.name}: {table.row_count} rows")
         """
         try:
-            # Get connection config and create connection to target namespace
-            from iris_devtester.config import discover_config
-            config = self.connection_config if self.connection_config else discover_config()
-
-            # Update config to use the target namespace
-            import dataclasses
-            namespace_config = dataclasses.replace(config, namespace=namespace)
-
             # Get connection to target namespace
-            conn = get_connection(namespace_config)
+            conn = self._namespace_connection(namespace)
             cursor = conn.cursor()
 
-            # Query for all tables
+            # Page catalog results so the driver overlaps network with
+            # processing and peak memory stays O(arraysize), not O(tables).
+            try:
+                cursor.arraysize = 500
+            except (AttributeError, TypeError):
+                pass
+
+            tables: List[TableInfo] = []
+
+            if not exact_counts:
+                # Single catalog lookup: EXTENTSIZE is IRIS's stored row
+                # estimate, milliseconds vs seconds-per-table scans.
+                try:
+                    cursor.execute(
+                        """
+                        SELECT TABLE_SCHEMA, TABLE_NAME, EXTENTSIZE
+                        FROM INFORMATION_SCHEMA.TABLES
+                        WHERE TABLE_TYPE = 'BASE TABLE'
+                        ORDER BY TABLE_SCHEMA, TABLE_NAME
+                        """
+                    )
+                    for row in self._iter_rows(cursor):
+                        qualified_name = f"{row[0]}.{row[1]}"
+                        row_count = int(row[2]) if row[2] is not None else 0
+                        tables.append(
+                            TableInfo(name=qualified_name, row_count=row_count)
+                        )
+                    cursor.close()
+                    return tables
+                except Exception:
+                    # Older IRIS versions without EXTENTSIZE: fall back to
+                    # exact counting below.
+                    tables = []
+
+            # Exact path: list tables, then COUNT(*) each one.
             cursor.execute(
                 """
                 SELECT TABLE_SCHEMA, TABLE_NAME
@@ -497,25 +890,63 @@ Halt"""
                 """
             )
 
-            tables = []
-            for row in cursor.fetchall():
-                schema_name = row[0]
-                table_name = row[1]
-                qualified_name = f"{schema_name}.{table_name}"
+            qualified_names = [
+                f"{row[0]}.{row[1]}" for row in self._iter_rows(cursor)
+            ]
 
-                # Get row count
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {qualified_name}")
-                    row_count = cursor.fetchone()[0]
+            # Pre-filter tables the current user can't SELECT with one ACL
+            # query, instead of paying a driver exception (round-trip +
+            # traceback) per forbidden table inside the count loop.
+            try:
+                cursor.execute(
+                    """
+                    SELECT TABLE_SCHEMA, TABLE_NAME
+                    FROM INFORMATION_SCHEMA.TABLE_PRIVILEGES
+                    WHERE PRIVILEGE_TYPE = 'SELECT'
+                      AND GRANTEE = CURRENT_USER
+                    """
+                )
+                readable = {
+                    f"{row[0]}.{row[1]}" for row in self._iter_rows(cursor)
+                }
+                if readable:
+                    qualified_names = [
+                        name for name in qualified_names if name in readable
+                    ]
+            except Exception:
+                # ACL catalog unavailable — the per-table fallback below
+                # still skips unreadable tables, just more slowly.
+                pass
 
-                    tables.append(TableInfo(name=qualified_name, row_count=row_count))
-                except Exception as table_error:
-                    # Skip tables we can't count (permissions, corrupted, etc.)
-                    # Log warning but continue
-                    continue
+            # Batch counts into UNION ALL statements (~100 tables each) so
+            # N tables cost a handful of round-trips instead of N.
+            batch_size = 100
+            for start in range(0, len(qualified_names), batch_size):
+                batch = qualified_names[start:start + batch_size]
+                # Table names are identifiers and can't be bound, but the
+                # label column can — parameterizing it keeps the statement
+                # text stable per batch size so the driver reuses the plan.
+                union_sql = " UNION ALL ".join(
+                    f"SELECT ? AS table_name, COUNT(*) AS row_count FROM {name}"
+                    for name in batch
+                )
+                try:
+                    cursor.execute(union_sql, tuple(batch))
+                    for name, row_count in cursor.fetchall():
+                        tables.append(TableInfo(name=name, row_count=row_count))
+                except Exception:
+                    # One bad table voids the whole batch (permissions,
+                    # corrupted, etc.) — retry this batch per-table.
+                    for name in batch:
+                        try:
+                            cursor.execute(f"SELECT COUNT(*) FROM {name}")
+                            row_count = cursor.fetchone()[0]
+                            tables.append(TableInfo(name=name, row_count=row_count))
+                        except Exception:
+                            # Skip tables we can't count
+                            continue
 
             cursor.close()
-            conn.close()
             return tables
 
         except Exception as e:
@@ -584,12 +1015,10 @@ Halt"""
                 "  2. Restore manifest.json from backup\n"
             )
 
-        # Load existing manifest
-        manifest = FixtureManifest.from_file(str(manifest_file))
-
-        # Create backup of old manifest
-        backup_file = fixture_path / "manifest.json.backup"
-        manifest.to_file(str(backup_file))
+        # Keep the old manifest bytes in memory for rollback — cheaper than
+        # a .backup file round-trip (and the read is a page-cache hit).
+        old_manifest_bytes = manifest_file.read_bytes()
+        manifest = FixtureManifest.from_json(old_manifest_bytes.decode())
 
         # Re-export namespace to IRIS.DAT
         dat_file_path = fixture_path / manifest.dat_file
@@ -601,16 +1030,27 @@ Halt"""
             # Export new .DAT file
             self.export_namespace_to_dat(namespace, str(dat_file_path))
 
-            # Get updated table list
-            tables = self.get_namespace_tables(namespace)
+            # Re-scan tables only when the catalog actually changed since
+            # the last export; an unchanged signature means the stored
+            # table list is still accurate.
+            signature = self._get_tables_signature(namespace)
+            if (
+                signature is not None
+                and signature == manifest.tables_signature
+                and manifest.tables
+            ):
+                tables = manifest.tables
+            else:
+                tables = self.get_namespace_tables(namespace)
 
             # Recalculate checksum
             checksum = self.calculate_checksum(str(dat_file_path))
 
             # Update manifest
             manifest.tables = tables
+            manifest.tables_signature = signature
             manifest.checksum = checksum
-            manifest.created_at = datetime.datetime.utcnow().isoformat() + "Z"
+            manifest.created_at = self._utc_timestamp()
             manifest.iris_version = self._get_iris_version()
 
             # Save updated manifest
@@ -619,10 +1059,8 @@ Halt"""
             return manifest
 
         except Exception as e:
-            # Restore backup on failure
-            if backup_file.exists():
-                manifest_backup = FixtureManifest.from_file(str(backup_file))
-                manifest_backup.to_file(str(manifest_file))
+            # Restore previous manifest on failure
+            manifest_file.write_bytes(old_manifest_bytes)
 
             if isinstance(e, FixtureCreateError):
                 raise
@@ -636,7 +1074,7 @@ Halt"""
                 "How to fix it:\n"
                 "  1. Verify namespace still exists\n"
                 "  2. Check IRIS connection\n"
-                "  3. Review previous manifest backup: manifest.json.backup\n"
+                "  3. The previous manifest.json has been restored\n"
             )
 
     def get_connection(self) -> Any:
@@ -658,21 +1096,58 @@ Halt"""
             self._connection = get_connection(self.connection_config)
         return self._connection
 
-    def _get_iris_version(self) -> str:
+    @contextmanager
+    def _scoped_cursor(self) -> Iterator[Any]:
+        """
+        Yield a cursor reused for the duration of one fixture operation.
+
+        Cursor creation/teardown on the IRIS DBAPI driver is not free;
+        sharing one cursor across the metadata queries of a single
+        create/refresh also lets the driver cache statement plans. The
+        cursor is closed when the outermost scope exits.
+        """
+        if self._cursor is not None:
+            # Nested call — reuse the already-open cursor.
+            yield self._cursor
+            return
+
+        self._cursor = self.get_connection().cursor()
+        try:
+            yield self._cursor
+        finally:
+            try:
+                self._cursor.close()
+            except Exception:
+                pass
+            self._cursor = None
+
+    def _get_iris_version(self, cursor: Optional[Any] = None) -> str:
         """
         Get IRIS version from system.
 
+        Cached for the lifetime of this instance — the server version
+        doesn't change between fixture operations, so repeat calls skip
+        the round-trip.
+
+        Args:
+            cursor: Optional cursor to reuse (avoids allocating one)
+
         Returns:
             IRIS version string (e.g., "2024.1")
         """
+        if self._iris_version is not None:
+            return self._iris_version
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT $SYSTEM.Version.GetVersion()")
-            row = cursor.fetchone()
-            cursor.close()
+            if cursor is not None:
+                cursor.execute("SELECT $SYSTEM.Version.GetVersion()")
+                row = cursor.fetchone()
+            else:
+                with self._scoped_cursor() as scoped:
+                    scoped.execute("SELECT $SYSTEM.Version.GetVersion()")
+                    row = scoped.fetchone()
             if row and row[0]:
-                return str(row[0])
+                self._iris_version = str(row[0])
+                return self._iris_version
             return "unknown"
         except Exception:
             return "unknown"
@@ -4,12 +4,16 @@ This module provides the DATFixtureLoader class for loading .DAT fixtures
 into IRIS namespaces via namespace mounting.
 """
 
+import atexit
+import os
+import re
+import threading
 import time
 import subprocess
 from subprocess import TimeoutExpired
 import logging
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Union
 
 from iris_devtester.connections import get_connection, IRISConnection
 from iris_devtester.config import IRISConfig
@@ -21,6 +25,68 @@ from .manifest import (
 )
 from .validator import FixtureValidator
 
+# FixtureValidator is stateless, so all loaders share one instance instead
+# of constructing a fresh validator per DATFixtureLoader().
+_DEFAULT_VALIDATOR = FixtureValidator()
+
+_VALID_NAMESPACE_RE = re.compile(r"^[A-Za-z0-9_%-]+$")
+
+
+def _validate_namespace_name(namespace: str) -> str:
+    """Validate a namespace name before interpolating it into ObjectScript."""
+    if not namespace or not _VALID_NAMESPACE_RE.match(namespace):
+        raise FixtureLoadError(
+            f"Invalid namespace name: {namespace!r}\n"
+            "\n"
+            "What went wrong:\n"
+            "  Namespace names may only contain letters, digits, '%', '_' and '-'.\n"
+            "  Other characters would break (or inject into) the restore script.\n"
+            "\n"
+            "How to fix it:\n"
+            "  1. Check the target_namespace argument for typos or stray quotes\n"
+            "  2. Use IRISContainer.get_test_namespace() to generate safe names\n"
+        )
+    return namespace
+
+# Per-thread connection pool keyed by (host, port, namespace). IRIS DBAPI
+# connects cost 50-200ms of TCP+auth; reusing one connection per worker
+# thread removes that from every load/verify/cleanup.
+_thread_pool = threading.local()
+_pooled_connections: list = []
+_pooled_lock = threading.Lock()
+
+
+def _pooled_connection(config: Any) -> Any:
+    """Get (or create) this thread's connection for the given config."""
+    pool = getattr(_thread_pool, "connections", None)
+    if pool is None:
+        pool = _thread_pool.connections = {}
+
+    key = (
+        getattr(config, "host", None),
+        getattr(config, "port", None),
+        getattr(config, "namespace", None),
+    )
+    conn = pool.get(key)
+    if conn is None:
+        conn = get_connection(config)
+        pool[key] = conn
+        with _pooled_lock:
+            _pooled_connections.append(conn)
+    return conn
+
+
+@atexit.register
+def _close_pooled_connections() -> None:
+    """Close all pooled connections at interpreter exit."""
+    with _pooled_lock:
+        for conn in _pooled_connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _pooled_connections.clear()
+
 
 class DATFixtureLoader:
     """
@@ -43,6 +109,65 @@ class DATFixtureLoader:
     Constitutional Principle #7: Medical-Grade Reliability
     """
 
+    # Prepared ObjectScript templates, built once at class definition and
+    # bound with validated parameters per call. IRIS has no persistent
+    # stored-procedure channel over `iris session`, so this is the closest
+    # analogue to a prepared statement: the ~20-line routine is never
+    # reassembled from scratch per load, and every interpolated value is
+    # either validated (namespace) or derived from a hex checksum (paths).
+    _REFRESH_DISMOUNT_TEMPLATE = """
+                    Set dbName = "{db_name}"
+                    If ##class(Config.Databases).Exists(dbName,.obj) {{
+                        Do ##class(SYS.Database).DismountDatabase(obj.Directory)
+                    }}
+                """
+
+    _SKIP_IF_EXISTS_TEMPLATE = """
+                    Do ##class(Config.Namespaces).Exists("{namespace}",.obj,.nsStatus)
+                    If nsStatus=1 Write "NAMESPACE_EXISTS","SUCCESS" Halt
+                """
+
+    _RESTORE_SCRIPT_TEMPLATE = """Set dbDir = "{db_dir}"
+Set dbName = "{db_name}"
+
+{refresh_commands}
+
+If '##class(%File).DirectoryExists(dbDir) Do ##class(%File).CreateDirectoryChain(dbDir)
+Do ##class(%File).CopyFile("{container_dat_path}",dbDir_"/IRIS.DAT")
+
+Set dbProps("Directory") = dbDir
+Set status = ##class(Config.Databases).Create(dbName,.dbProps)
+If status'=1 Write "DB_CREATE_FAILED" Halt
+
+Set nsProps("Globals") = dbName
+Set nsProps("Routines") = dbName
+Set nsProps("TempGlobals") = "IRISTEMP"
+            Set status = ##class(Config.Namespaces).Create("{namespace}",.nsProps)
+            If status'=1 Write "NAMESPACE_CREATE_FAILED" Halt
+
+            Write "SUCCESS"
+            Halt"""
+
+    # Server-side table cleanup: enumerates and drops (or truncates) every
+    # base table inside one transaction, in a single iris session call —
+    # O(1) docker round-trips instead of one SQL statement per table.
+    # Every statement is a single line: multi-line brace blocks piped into
+    # `iris session` are the documented blind alley (the terminal executes
+    # line by line), so the loop body stays on one line and the error
+    # paths use postconditionals instead of brace blocks.
+    _CLEANUP_TABLES_SCRIPT_TEMPLATE = """ZN "{namespace}"
+TSTART
+Set stmt = ##class(%SQL.Statement).%New()
+Set sc = stmt.%Prepare("SELECT TABLE_SCHEMA,TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'")
+If sc'=1 TROLLBACK  Write "PREPARE_FAILED" Halt
+Set rs = stmt.%Execute()
+Set failed = ""
+While rs.%Next() {{ Set tbl = rs.%Get("TABLE_SCHEMA")_"."_rs.%Get("TABLE_NAME") Set drop = ##class(%SQL.Statement).%ExecDirect(, "{verb} "_tbl) Set:drop.%SQLCODE<0 failed = tbl_" SQLCODE="_drop.%SQLCODE Quit:failed'=""  }}
+If failed'="" TROLLBACK  Write "CLEANUP_FAILED: "_failed Halt
+TCOMMIT
+Write "SUCCESS"
+Halt"""
+
     def __init__(self, connection_config: Optional[IRISConfig] = None, container: Optional[Any] = None):
         """
         Initialize fixture loader.
@@ -69,7 +194,7 @@ class DATFixtureLoader:
         """
         self.connection_config = connection_config
         self.container = container
-        self.validator = FixtureValidator()
+        self.validator = _DEFAULT_VALIDATOR
         self._owns_container = False  # Track if we auto-created the container
         self._connection: Optional[Any] = None
 
@@ -100,14 +225,16 @@ class DATFixtureLoader:
         self.close()
 
     def validate_fixture(
-        self, fixture_path: str, validate_checksum: bool = True
+        self, fixture_path: str, validate_checksum: Union[bool, str] = True
     ) -> FixtureManifest:
         """
         Validate fixture before loading.
 
         Args:
             fixture_path: Path to fixture directory
-            validate_checksum: Validate IRIS.DAT checksum (default: True)
+            validate_checksum: Validate IRIS.DAT checksum (default: True).
+                              Pass "auto" to skip rehashing when the file's
+                              size and mtime match the last validated state
 
         Returns:
             FixtureManifest if validation succeeds
@@ -135,6 +262,8 @@ class DATFixtureLoader:
         target_namespace: Optional[str] = None,
         validate_checksum: bool = True,
         force_refresh: bool = False,
+        verify_row_counts: bool = False,
+        verify_mode: str = "sample",
     ) -> LoadResult:
         """
         Load fixture into IRIS namespace.
@@ -150,6 +279,15 @@ class DATFixtureLoader:
             target_namespace: Target namespace name (default: use manifest's namespace)
             validate_checksum: Validate IRIS.DAT checksum before loading (default: True)
             force_refresh: If True, delete existing namespace before loading (default: False)
+            verify_row_counts: If True, force verify_mode="full" (kept for
+                              backward compatibility)
+            verify_mode: Verification depth after restore (default: "sample"):
+                        - "none": trust the restore, skip verification
+                        - "sample": check tables exist, then probe first/last
+                          %ID of each non-empty table (2 indexed lookups per
+                          table — detects truncated restores without scans)
+                        - "full": existence check plus bulk COUNT(*) of every
+                          table against the manifest (use in CI)
 
         Returns:
             LoadResult with success status, manifest, and timing info
@@ -168,29 +306,29 @@ class DATFixtureLoader:
         """
         start_time = time.time()
 
-        # Step 1: Validate fixture
-        manifest = self.validate_fixture(fixture_path, validate_checksum)
+        if verify_row_counts:
+            verify_mode = "full"
+        if verify_mode not in ("none", "sample", "full"):
+            raise ValueError(
+                f"verify_mode must be 'none', 'sample' or 'full', got {verify_mode!r}"
+            )
+
+        # Resolve once up front and hand the resolved directory to the
+        # validator, so both steps walk the same absolute path and the
+        # validator's own stat of IRIS.DAT doubles as our existence check
+        # (no second resolve()/exists() round of syscalls).
+        fixture_dir = Path(fixture_path).resolve()
+
+        # Step 1: Validate fixture (raises if manifest or IRIS.DAT missing)
+        manifest = self.validate_fixture(str(fixture_dir), validate_checksum)
 
         # Use manifest namespace if target not specified
-        namespace = target_namespace or manifest.namespace
+        namespace = _validate_namespace_name(
+            target_namespace or manifest.namespace
+        )
 
-        # Get absolute path to IRIS.DAT file
-        fixture_dir = Path(fixture_path).resolve()
         dat_file_path = fixture_dir / manifest.dat_file
 
-        if not dat_file_path.exists():
-            raise FixtureLoadError(
-                f"IRIS.DAT file not found: {dat_file_path}\n"
-                "\n"
-                "What went wrong:\n"
-                f"  The manifest specifies '{manifest.dat_file}' but it doesn't exist.\n"
-                "\n"
-                "How to fix it:\n"
-                "  1. Verify the fixture directory is correct\n"
-                "  2. Check if the .DAT file was renamed or moved\n"
-                "  3. Re-create the fixture if necessary\n"
-            )
-
         # Step 2: Mount database via docker exec (similar to creator BACKUP approach)
         # Cannot use iris.connect() + iris.execute() - only works in embedded Python
         try:
@@ -227,28 +365,38 @@ class DATFixtureLoader:
 
             container_name = self.container.get_container_name()
 
-            # First, copy the DAT file into the container
-            container_dat_path = f"/tmp/RESTORE_{namespace}.DAT"
-
-            cp_to_container_cmd = [
-                "docker",
-                "cp",
-                str(dat_file_path),
-                f"{container_name}:{container_dat_path}"
-            ]
+            # Stage the DAT file in the container as a template, keyed by
+            # its checksum. Loading the same fixture into N namespaces then
+            # streams the file from host to container once; each namespace
+            # clones it with a fast in-container copy instead.
+            checksum_tag = manifest.checksum.split(":", 1)[-1][:16]
+            container_dat_path = f"/tmp/FIXTURE_{checksum_tag}.DAT"
 
-            cp_result = subprocess.run(
-                cp_to_container_cmd, capture_output=True, text=True, timeout=30
+            staged_check = subprocess.run(
+                ["docker", "exec", container_name, "test", "-f", container_dat_path],
+                capture_output=True, text=True, timeout=10
             )
 
-            if cp_result.returncode != 0:
-                raise FixtureLoadError(
-                    f"Failed to copy DAT file to container\n"
-                    f"DAT file: {dat_file_path}\n"
-                    f"Container path: {container_dat_path}\n"
-                    f"stderr: {cp_result.stderr}\n"
+            if staged_check.returncode != 0:
+                cp_to_container_cmd = [
+                    "docker",
+                    "cp",
+                    str(dat_file_path),
+                    f"{container_name}:{container_dat_path}"
+                ]
+
+                cp_result = subprocess.run(
+                    cp_to_container_cmd, capture_output=True, text=True, timeout=30
                 )
 
+                if cp_result.returncode != 0:
+                    raise FixtureLoadError(
+                        f"Failed to copy DAT file to container\n"
+                        f"DAT file: {dat_file_path}\n"
+                        f"Container path: {container_dat_path}\n"
+                        f"stderr: {cp_result.stderr}\n"
+                    )
+
             # Mount database via ObjectScript
             # RESTORE sequence:
             # 1. Create directory and copy IRIS.DAT
@@ -267,40 +415,21 @@ class DATFixtureLoader:
             #
             # ObjectScript syntax note: No braces needed, just If...Else...
             if force_refresh:
-                refresh_commands = f"""
-                    Set dbName = "{db_name}"
-                    If ##class(Config.Databases).Exists(dbName,.obj) {{
-                        Do ##class(SYS.Database).DismountDatabase(obj.Directory)
-                    }}
-                """
+                refresh_commands = self._REFRESH_DISMOUNT_TEMPLATE.format(
+                    db_name=db_name
+                )
             else:
-                refresh_commands = f"""
-                    Do ##class(Config.Namespaces).Exists("{namespace}",.obj,.nsStatus)
-                    If nsStatus=1 Write "NAMESPACE_EXISTS","SUCCESS" Halt
-                """
-
-            objectscript_commands = f"""Set dbDir = "{db_dir}"
-Set dbName = "{db_name}"
-
-{refresh_commands}
-
-If '##class(%File).DirectoryExists(dbDir) Do ##class(%File).CreateDirectoryChain(dbDir)
-Do ##class(%File).CopyFile("{container_dat_path}",dbDir_"/IRIS.DAT")
-
-Set dbProps("Directory") = dbDir
-Set status = ##class(Config.Databases).Create(dbName,.dbProps)
-If status'=1 Write "DB_CREATE_FAILED" Halt
-
-Set nsProps("Globals") = dbName
-Set nsProps("Routines") = dbName
-Set nsProps("TempGlobals") = "IRISTEMP"
-            Set status = ##class(Config.Namespaces).Create("{namespace}",.nsProps)
-            If status'=1 Write "NAMESPACE_CREATE_FAILED" Halt
-
-            Write "SUCCESS"
-            Halt"""
-
+                refresh_commands = self._SKIP_IF_EXISTS_TEMPLATE.format(
+                    namespace=namespace
+                )
 
+            objectscript_commands = self._RESTORE_SCRIPT_TEMPLATE.format(
+                db_dir=db_dir,
+                db_name=db_name,
+                refresh_commands=refresh_commands,
+                container_dat_path=container_dat_path,
+                namespace=namespace,
+            )
 
             cmd = [
                 "docker",
@@ -385,7 +514,15 @@ Set nsProps("TempGlobals") = "IRISTEMP"
             )
 
         # Step 3: Verify mount success by checking tables exist
-        tables_loaded = []
+        tables_loaded = [table_info.name for table_info in manifest.tables]
+        if verify_mode == "none":
+            return LoadResult(
+                success=True,
+                manifest=manifest,
+                namespace=namespace,
+                tables_loaded=tables_loaded,
+                elapsed_seconds=time.time() - start_time,
+            )
         try:
             # Get connection config and create connection to target namespace
             from iris_devtester.config import discover_config
@@ -394,40 +531,54 @@ Set nsProps("TempGlobals") = "IRISTEMP"
             config = self.connection_config if self.connection_config else discover_config()
             namespace_config = dataclasses.replace(config, namespace=namespace)
 
-            # Get connection to target namespace
-            conn = get_connection(namespace_config)
+            # Get pooled connection to target namespace (reused across
+            # loads on this thread) with one cursor for the whole loop
+            conn = _pooled_connection(namespace_config)
             cursor = conn.cursor()
 
-            # Verify each table exists
-            for table_info in manifest.tables:
-                # Query table to verify it exists and has expected rows
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table_info.name}")
-                    row_count = cursor.fetchone()[0]
-
-                    # Warn if row count doesn't match (but don't fail)
-                    if row_count != table_info.row_count:
-                        # Note: This is a warning, not an error
-                        # Row counts can legitimately differ after restore
-                        pass
+            # Verify all tables exist with a single catalog query instead
+            # of one COUNT(*) scan + round-trip per table
+            cursor.execute(
+                """
+                SELECT TABLE_SCHEMA, TABLE_NAME
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE TABLE_TYPE = 'BASE TABLE'
+                """
+            )
+            present = {f"{row[0]}.{row[1]}" for row in cursor.fetchall()}
 
-                    tables_loaded.append(table_info.name)
-                except Exception as table_error:
-                    raise FixtureLoadError(
-                        f"Failed to verify table '{table_info.name}' in namespace '{namespace}'\n"
-                        f"Error: {table_error}\n"
-                        "\n"
-                        "What went wrong:\n"
-                        "  The namespace was restored but table verification failed.\n"
-                        "\n"
-                        "How to fix it:\n"
-                        "  1. Check if the table exists: SELECT * FROM INFORMATION_SCHEMA.TABLES\n"
-                        "  2. Verify namespace is correct\n"
-                        "  3. Try recreating the fixture from source\n"
-                    )
+            missing = [
+                table_info.name
+                for table_info in manifest.tables
+                if table_info.name not in present
+            ]
+            if missing:
+                missing_list = "\n".join(f"  - {name}" for name in missing)
+                raise FixtureLoadError(
+                    f"Failed to verify tables in namespace '{namespace}'\n"
+                    f"Missing tables:\n{missing_list}\n"
+                    "\n"
+                    "What went wrong:\n"
+                    "  The namespace was restored but table verification failed.\n"
+                    "\n"
+                    "How to fix it:\n"
+                    "  1. Check if the tables exist: SELECT * FROM INFORMATION_SCHEMA.TABLES\n"
+                    "  2. Verify namespace is correct\n"
+                    "  3. Try recreating the fixture from source\n"
+                )
 
             cursor.close()
-            conn.close()
+
+            if manifest.tables:
+                if verify_mode == "full":
+                    # Deep check: bulk COUNT(*) of every manifest table
+                    # via batched UNION ALL — one roundtrip per batch.
+                    self._verify_row_counts_parallel(conn, namespace, manifest)
+                else:
+                    # Sample check: probe the first and last %ID of each
+                    # non-empty table — O(log N) index lookups instead of
+                    # full COUNT(*) scans, enough to catch truncation.
+                    self._verify_row_samples(conn, namespace, manifest)
 
         except Exception as e:
             if isinstance(e, FixtureLoadError):
@@ -456,8 +607,202 @@ Set nsProps("TempGlobals") = "IRISTEMP"
             elapsed_seconds=elapsed_seconds,
         )
 
+    def load_fixture_shared(
+        self,
+        fixture_path: str,
+        prefix: str = "SHARED",
+        reset_tables: bool = False,
+        **load_kwargs: Any,
+    ) -> LoadResult:
+        """
+        Load a fixture once per pytest worker and reuse it across tests.
+
+        The target namespace is derived from the fixture path (not the
+        test nodeid), so every parametrized variant and sibling test that
+        shares the same fixture reuses one restored namespace: N
+        parametrizations cost one .DAT restore instead of N. Namespaces
+        are suffixed with the xdist worker id, keeping parallel workers
+        isolated.
+
+        Args:
+            fixture_path: Path to fixture directory
+            prefix: Namespace prefix (default: "SHARED")
+            reset_tables: If True, restore pristine fixture state before
+                         returning: the cached namespace is deleted and
+                         the fixture reloaded — for tests that mutate
+                         fixture data (default: False, reuse as-is)
+            **load_kwargs: Passed through to load_fixture on first load
+
+        Returns:
+            LoadResult (cached after the first load per worker)
+
+        Example:
+            >>> @pytest.fixture
+            ... def shared_fixture(iris_container):
+            ...     loader = get_shared_loader(container=iris_container)
+            ...     return loader.load_fixture_shared("./fixtures/test-data")
+        """
+        import hashlib
+
+        fixture_key = str(Path(fixture_path).resolve())
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        cache_key = (worker, fixture_key)
+
+        with _shared_fixtures_lock:
+            cached = _shared_fixtures.get(cache_key)
+        if cached is not None:
+            if not reset_tables:
+                return cached
+            # The caller wants pristine fixture data, and the cached
+            # namespace may have been mutated by earlier tests. Drop the
+            # cache entry and the namespace, then fall through to a fresh
+            # load — truncating would hand back empty tables under a
+            # LoadResult still claiming the manifest's row counts.
+            with _shared_fixtures_lock:
+                _shared_fixtures.pop(cache_key, None)
+            self.cleanup_fixture(cached.namespace, delete_namespace=True)
+
+        digest = hashlib.blake2b(
+            fixture_key.encode(), digest_size=6
+        ).hexdigest().upper()
+        namespace = f"{prefix}_{worker.upper()}_{digest}"
+
+        result = self.load_fixture(
+            fixture_path, target_namespace=namespace, **load_kwargs
+        )
+        with _shared_fixtures_lock:
+            _shared_fixtures[cache_key] = result
+        return result
+
+    # Tables counted per UNION ALL statement; matches FixtureCreator's
+    # exact-count batching so statement size stays well under IRIS limits.
+    _COUNT_BATCH_SIZE = 100
+
+    def _verify_row_samples(
+        self, conn: Any, namespace: str, manifest: FixtureManifest
+    ) -> None:
+        """
+        Spot-check each non-empty manifest table with indexed %ID probes.
+
+        Reads the first and last %ID per table (TOP 1 ordered ASC/DESC) —
+        two O(log N) index lookups instead of an O(N) COUNT(*) scan. A
+        table the manifest says has rows but returns no %ID indicates a
+        truncated or corrupted restore. Problems are aggregated into one
+        FixtureLoadError, mirroring the full-count path.
+
+        Raises:
+            FixtureLoadError: If a non-empty table has no rows or can't
+                             be probed
+        """
+        problems: list = []
+        cursor = conn.cursor()
+        try:
+            for table_info in manifest.tables:
+                if table_info.row_count == 0:
+                    continue
+                try:
+                    cursor.execute(
+                        f"SELECT TOP 1 %ID FROM {table_info.name} ORDER BY %ID ASC"
+                    )
+                    first = cursor.fetchone()
+                    cursor.execute(
+                        f"SELECT TOP 1 %ID FROM {table_info.name} ORDER BY %ID DESC"
+                    )
+                    last = cursor.fetchone()
+                except Exception as e:
+                    problems.append(f"  - {table_info.name}: probe failed ({e})")
+                    continue
+                if first is None or last is None:
+                    problems.append(
+                        f"  - {table_info.name}: expected "
+                        f"{table_info.row_count} rows, found none"
+                    )
+        finally:
+            cursor.close()
+
+        if problems:
+            problem_list = "\n".join(problems)
+            raise FixtureLoadError(
+                f"Sample verification failed in namespace '{namespace}'\n"
+                f"{problem_list}\n"
+                "\n"
+                "What went wrong:\n"
+                "  Restored tables that should contain rows came back empty.\n"
+                "\n"
+                "How to fix it:\n"
+                "  1. Re-load with verify_mode='full' for exact counts\n"
+                "  2. Re-create the fixture from the source namespace\n"
+            )
+
+    def _verify_row_counts_parallel(
+        self, conn: Any, namespace: str, manifest: FixtureManifest
+    ) -> None:
+        """
+        COUNT(*) every manifest table and compare against the manifest.
+
+        Counts are bulk-fetched with batched UNION ALL statements (one
+        roundtrip per ~100 tables instead of one per table); any batch
+        that fails falls back to per-table counts so a single broken
+        table still reports precisely. All mismatches and errors are
+        aggregated into one FixtureLoadError for better diagnostics than
+        failing on the first table.
+
+        Raises:
+            FixtureLoadError: If any table's count doesn't match or can't
+                             be read
+        """
+        expected = {t.name: t.row_count for t in manifest.tables}
+        problems: list = []
+        cursor = conn.cursor()
+        try:
+            names = list(expected)
+            for start in range(0, len(names), self._COUNT_BATCH_SIZE):
+                batch = names[start:start + self._COUNT_BATCH_SIZE]
+                union_sql = " UNION ALL ".join(
+                    f"SELECT ? AS table_name, COUNT(*) FROM {name}"
+                    for name in batch
+                )
+                try:
+                    cursor.execute(union_sql, batch)
+                    rows = cursor.fetchall()
+                except Exception:
+                    # A single missing/broken table fails the whole batch;
+                    # retry one at a time to attribute the error.
+                    rows = []
+                    for name in batch:
+                        try:
+                            cursor.execute(f"SELECT COUNT(*) FROM {name}")
+                            rows.append((name, cursor.fetchone()[0]))
+                        except Exception as e:
+                            problems.append(
+                                f"  - {name}: count failed ({e})"
+                            )
+                for name, actual in rows:
+                    if actual != expected[name]:
+                        problems.append(
+                            f"  - {name}: expected "
+                            f"{expected[name]} rows, found {actual}"
+                        )
+        finally:
+            cursor.close()
+
+        if problems:
+            problem_list = "\n".join(problems)
+            raise FixtureLoadError(
+                f"Row count verification failed in namespace '{namespace}'\n"
+                f"{problem_list}\n"
+                "\n"
+                "What went wrong:\n"
+                "  Restored tables don't match the manifest's row counts.\n"
+                "\n"
+                "How to fix it:\n"
+                "  1. Re-create the fixture from the source namespace\n"
+                "  2. Or refresh the manifest: creator.refresh_fixture()\n"
+            )
+
     def cleanup_fixture(
-        self, namespace: str, delete_namespace: bool = False
+        self, namespace: str, delete_namespace: bool = False,
+        truncate_tables: bool = False
     ) -> None:
         """
         Cleanup loaded fixture.
@@ -466,6 +811,9 @@ Set nsProps("TempGlobals") = "IRISTEMP"
             namespace: Namespace to cleanup
             delete_namespace: If True, delete the namespace entirely.
                              If False, just unmount (namespace remains but data removed).
+            truncate_tables: If True (and not deleting the namespace),
+                            TRUNCATE tables instead of dropping them —
+                            faster when the schema is reused across tests.
 
         Raises:
             FixtureLoadError: If cleanup fails
@@ -532,6 +880,12 @@ Halt"""
                         "  2. Try deleting manually via IRIS Management Portal\n"
                         "  3. Check if namespace is in use by other connections\n"
                     )
+            elif self.container:
+                # One server-side pass: enumerate and drop all tables in a
+                # single iris session transaction, no Python<->IRIS chatter.
+                self._cleanup_tables_server_side(
+                    _validate_namespace_name(namespace), truncate_tables
+                )
             else:
                 conn = self.get_connection()
                 cursor = conn.cursor()
@@ -540,11 +894,30 @@ Halt"""
                     "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'"
                 )
                 tables = [row[0] for row in cursor.fetchall()]
+                cursor.close()
 
-                for table_name in tables:
-                    cursor.execute(f"DROP TABLE {table_name}")
+                # Drop (or truncate) tables concurrently — each worker uses
+                # its own pooled connection, overlapping the per-statement
+                # round-trips instead of serializing them.
+                statement = (
+                    "TRUNCATE TABLE {}" if truncate_tables else "DROP TABLE {}"
+                )
 
-                cursor.close()
+                def _cleanup_table(table_name: str) -> None:
+                    worker_cursor = _pooled_connection(
+                        self.connection_config
+                    ).cursor()
+                    try:
+                        worker_cursor.execute(statement.format(table_name))
+                    finally:
+                        worker_cursor.close()
+
+                if tables:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(max_workers=8) as pool:
+                        # list() propagates the first worker exception
+                        list(pool.map(_cleanup_table, tables))
 
         except Exception as e:
             if isinstance(e, FixtureLoadError):
@@ -562,6 +935,54 @@ Halt"""
                 "  3. Restart IRIS if necessary\n"
             )
 
+    def _cleanup_tables_server_side(
+        self, namespace: str, truncate_tables: bool
+    ) -> None:
+        """
+        Drop (or truncate) every base table in one iris session call.
+
+        The enumerate-and-drop loop runs entirely server-side inside a
+        transaction, so either all tables are cleaned or none are, and
+        the cost is one docker exec instead of one SQL roundtrip per
+        table.
+
+        Raises:
+            FixtureLoadError: If the cleanup script fails
+        """
+        import subprocess
+
+        container_name = self.container.get_container_name()
+        verb = "TRUNCATE TABLE" if truncate_tables else "DROP TABLE"
+        script = self._CLEANUP_TABLES_SCRIPT_TEMPLATE.format(
+            namespace=namespace, verb=verb
+        )
+
+        result = subprocess.run(
+            [
+                "docker", "exec", "-i", container_name,
+                "iris", "session", "IRIS", "-U", "%SYS",
+            ],
+            input=f"{script}\nHalt\n",
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        if result.returncode != 0 or "SUCCESS" not in result.stdout:
+            raise FixtureLoadError(
+                f"Failed to clean up tables in namespace '{namespace}'\n"
+                f"stdout: {result.stdout}\n"
+                f"stderr: {result.stderr}\n"
+                "\n"
+                "What went wrong:\n"
+                "  The server-side table cleanup script did not complete.\n"
+                "\n"
+                "How to fix it:\n"
+                "  1. Verify namespace exists: do $SYSTEM.OBJ.ListNamespaces()\n"
+                "  2. Check for open transactions holding table locks\n"
+                "  3. Review IRIS logs for the failing DROP/TRUNCATE\n"
+            )
+
     def get_connection(self) -> Any:
         """
         Get or create IRIS connection.
@@ -578,5 +999,65 @@ Halt"""
             >>> cursor = conn.cursor()
         """
         if self._connection is None:
-            self._connection = get_connection(self.connection_config)
+            if self.connection_config is not None:
+                self._connection = _pooled_connection(self.connection_config)
+            else:
+                self._connection = get_connection(self.connection_config)
         return self._connection
+
+
+# Per-worker record of fixtures already restored, keyed by
+# (pytest worker id, resolved fixture path). Parametrized tests sharing a
+# fixture path hit the cache instead of re-restoring the .DAT per variant.
+_shared_fixtures: dict = {}
+_shared_fixtures_lock = threading.Lock()
+
+
+# Process-wide loader cache so pytest fixtures that load .DAT fixtures on
+# every test reuse one DATFixtureLoader per target instead of constructing
+# a fresh one each time. Reuse compounds: the shared loader keeps its
+# pooled connections warm and the validator's manifest/sidecar caches hot.
+_shared_loaders: dict = {}
+_shared_loaders_lock = threading.Lock()
+
+
+def get_shared_loader(
+    connection_config: Optional[IRISConfig] = None,
+    container: Optional[Any] = None,
+) -> DATFixtureLoader:
+    """
+    Get a cached DATFixtureLoader for the given connection target.
+
+    Loaders are cached per (host, port, namespace, container name) for the
+    life of the process, so per-test pytest fixtures can call this instead
+    of instantiating DATFixtureLoader directly:
+
+        @pytest.fixture
+        def loaded_fixture(iris_container):
+            loader = get_shared_loader(container=iris_container)
+            ...
+
+    Args:
+        connection_config: Optional explicit connection configuration
+        container: Optional IRISContainer (for docker exec operations)
+
+    Returns:
+        Shared DATFixtureLoader for the target (created on first use)
+    """
+    container_key = None
+    if container is not None:
+        container_key = getattr(container, "container_name", None) or id(container)
+    key = (
+        getattr(connection_config, "host", None),
+        getattr(connection_config, "port", None),
+        getattr(connection_config, "namespace", None),
+        container_key,
+    )
+    with _shared_loaders_lock:
+        loader = _shared_loaders.get(key)
+        if loader is None:
+            loader = DATFixtureLoader(
+                connection_config=connection_config, container=container
+            )
+            _shared_loaders[key] = loader
+        return loader
@@ -9,6 +9,13 @@ from typing import List, Dict, Any, Optional
 import json
 from pathlib import Path
 
+try:
+    import orjson  # ~5-10x faster serialization for manifests with many tables
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 # Custom Exceptions
 class FixtureError(Exception):
@@ -105,6 +112,7 @@ class FixtureManifest:
     # Optional fields
     features: Optional[Dict[str, Any]] = None  # Additional metadata
     known_queries: Optional[List[Dict[str, Any]]] = None  # Test scenarios
+    tables_signature: Optional[str] = None  # Hash of catalog extent sizes
 
     def to_json(self, indent: int = 2) -> str:
         """
@@ -117,6 +125,10 @@ class FixtureManifest:
             JSON string representation
         """
         data = asdict(self)
+        # orjson only supports 2-space indentation; honor custom indents
+        # via stdlib.
+        if _HAS_ORJSON and indent == 2:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(data, indent=indent)
 
     @classmethod
@@ -134,8 +146,12 @@ class FixtureManifest:
             ValueError: If JSON is invalid or missing required fields
         """
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            # orjson parses ~5-10x faster; both raise ValueError subclasses
+            if _HAS_ORJSON:
+                data = orjson.loads(json_str)
+            else:
+                data = json.loads(json_str)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
         # Convert table dicts to TableInfo objects
@@ -171,16 +187,22 @@ class FixtureManifest:
 
     def to_file(self, manifest_path: str) -> None:
         """
-        Save manifest to file.
+        Save manifest to file atomically.
+
+        Writes to a temporary sibling then renames over the target, so a
+        partially written manifest.json is never observable.
 
         Args:
             manifest_path: Path to manifest.json file
         """
+        import os
+
         path = Path(manifest_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(manifest_path, "w") as f:
-            f.write(self.to_json())
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(self.to_json().encode())
+        os.replace(tmp_path, path)
 
     def validate(self) -> "ValidationResult":
         """
@@ -207,8 +229,10 @@ class FixtureManifest:
             warnings.append(f"dat_file '{self.dat_file}' should typically be 'IRIS.DAT'")
         if not self.checksum:
             errors.append("checksum is empty")
-        elif not self.checksum.startswith("sha256:"):
-            errors.append("checksum must start with 'sha256:'")
+        elif not self.checksum.startswith(("sha256:", "sha256tree:", "blake3:")):
+            errors.append(
+                "checksum must start with 'sha256:', 'sha256tree:' or 'blake3:'"
+            )
         if not self.tables:
             errors.append("tables list is empty")
 
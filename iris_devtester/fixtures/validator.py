@@ -4,9 +4,12 @@ This module provides the FixtureValidator class for validating fixture
 integrity including manifest structure, file existence, and SHA256 checksums.
 """
 
+import copy
 import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from .manifest import (
     FixtureManifest,
@@ -16,6 +19,29 @@ from .manifest import (
 )
 
 
+@lru_cache(maxsize=64)
+def _load_manifest_cached(
+    manifest_path: str, mtime_ns: int, size: int
+) -> FixtureManifest:
+    """
+    Parse a manifest, cached on (path, mtime_ns, size).
+
+    The stat tuple participates in the key, so any rewrite of
+    manifest.json naturally misses the cache. Callers receive a deep copy
+    (see _read_manifest) so mutation can't poison cached entries.
+    """
+    return FixtureManifest.from_file(manifest_path)
+
+
+def _read_manifest(manifest_path: Path) -> FixtureManifest:
+    """Load a manifest via the stat-keyed cache, returning a private copy."""
+    stat = os.stat(manifest_path)
+    cached = _load_manifest_cached(
+        str(manifest_path), stat.st_mtime_ns, stat.st_size
+    )
+    return copy.deepcopy(cached)
+
+
 class FixtureValidator:
     """
     Validates .DAT fixture integrity.
@@ -35,6 +61,10 @@ class FixtureValidator:
         ...     print(f"Errors: {result.errors}")
     """
 
+    # Files at or above this size are hashed via mmap (zero-copy);
+    # smaller files use the streaming readinto loop.
+    _MMAP_THRESHOLD = 16 * 1024 * 1024
+
     def __init__(self):
         """Initialize fixture validator (stateless, no configuration needed)."""
         pass
@@ -64,18 +94,219 @@ class FixtureValidator:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        # Large files: hash the mapped pages directly (zero user-space
+        # copies, GIL released for the whole digest). Fall through to the
+        # streaming loop if the filesystem refuses to map.
+        if path.stat().st_size >= self._MMAP_THRESHOLD:
+            try:
+                return self._calculate_sha256_mmap(file_path)
+            except (ValueError, OSError):
+                pass
+
+        # Python 3.11+: hashlib.file_digest drives the read loop in C and
+        # releases the GIL for the whole digest, so OpenSSL's accelerated
+        # SHA256 (SHA-NI where available) runs without per-chunk Python
+        # overhead. Older interpreters fall through to the readinto loop.
+        if hasattr(hashlib, "file_digest"):
+            try:
+                with open(file_path, "rb") as f:
+                    digest = hashlib.file_digest(f, "sha256")
+                return f"sha256:{digest.hexdigest()}"
+            except IOError as e:
+                raise IOError(f"Failed to read file {file_path}: {e}")
+
         sha256_hash = hashlib.sha256()
 
+        # readinto a reusable buffer avoids allocating a fresh bytes object
+        # (and its memcpy) per chunk, keeping the loop memory-bound.
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+
         try:
-            with open(file_path, "rb") as f:
-                # Read file in chunks to handle large files efficiently
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    sha256_hash.update(chunk)
+            with open(file_path, "rb", buffering=0) as f:
+                # Hint sequential streaming so the kernel prefetches ahead
+                # and evicts pages behind us (Linux only).
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(
+                            f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                        )
+                    except OSError:
+                        pass
+
+                while True:
+                    n = f.readinto(view)
+                    if not n:
+                        break
+                    sha256_hash.update(view[:n])
         except IOError as e:
             raise IOError(f"Failed to read file {file_path}: {e}")
 
         return f"sha256:{sha256_hash.hexdigest()}"
 
+    def _calculate_sha256_mmap(self, file_path: str) -> str:
+        """
+        Calculate SHA256 by hashing a memory-mapped view of the file.
+
+        hashlib operates on the mapped pages directly, so there is no
+        user-space buffering and the kernel's readahead does the I/O.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            SHA256 checksum in format "sha256:abc123..."
+
+        Raises:
+            ValueError: If the file cannot be mapped (e.g. empty file)
+            OSError: If mapping or reading fails
+        """
+        import mmap
+
+        with open(file_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if hasattr(mm, "madvise"):
+                    try:
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    except (OSError, AttributeError):
+                        pass
+                return f"sha256:{hashlib.sha256(mm).hexdigest()}"
+            finally:
+                mm.close()
+
+    def calculate_sha256_tree(
+        self, file_path: str, segment_size: int = 64 * 1024 * 1024
+    ) -> str:
+        """
+        Calculate a parallel SHA256 tree-hash for a file.
+
+        SHA256 itself is sequential, but hashing fixed-size segments and
+        then hashing the concatenated segment digests (a Merkle-style tree
+        of depth 1) parallelizes across cores — hashlib releases the GIL
+        during updates, so threads scale nearly linearly on multi-GB files.
+
+        Note the result is NOT interchangeable with a plain SHA256 digest;
+        it uses the "sha256tree:" prefix so validators pick the matching
+        algorithm.
+
+        Args:
+            file_path: Path to file
+            segment_size: Segment size in bytes (default: 64MB). The digest
+                         depends on this value — verification must use the
+                         same size, so leave it at the default for
+                         manifests.
+
+        Returns:
+            Tree-hash checksum in format "sha256tree:abc123..."
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            IOError: If file cannot be read
+
+        Example:
+            >>> validator = FixtureValidator()
+            >>> checksum = validator.calculate_sha256_tree("./fixtures/test/IRIS.DAT")
+            >>> checksum.startswith("sha256tree:")
+            True
+        """
+        import mmap
+        from concurrent.futures import ThreadPoolExecutor
+
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        size = path.stat().st_size
+        if size == 0:
+            # mmap can't map empty files; a zero-byte tree has no leaves.
+            return f"sha256tree:{hashlib.sha256(b'').hexdigest()}"
+
+        try:
+            with open(file_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        segments = [
+                            view[start:start + segment_size]
+                            for start in range(0, size, segment_size)
+                        ]
+                        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                            leaf_hashes = list(
+                                pool.map(
+                                    lambda seg: hashlib.sha256(seg).digest(),
+                                    segments,
+                                )
+                            )
+                    finally:
+                        del segments
+                        view.release()
+        except IOError as e:
+            raise IOError(f"Failed to read file {file_path}: {e}")
+
+        return f"sha256tree:{hashlib.sha256(b''.join(leaf_hashes)).hexdigest()}"
+
+    def calculate_blake3(self, file_path: str, chunk_size: int = 1 << 20) -> str:
+        """
+        Calculate a BLAKE3 checksum for a file.
+
+        BLAKE3 is ~6-10x faster than SHA256 on hosts whose OpenSSL build
+        lacks SHA-NI acceleration (it uses SIMD internally and hashes in
+        parallel). Requires the optional `blake3` package.
+
+        Args:
+            file_path: Path to file
+            chunk_size: Read chunk size in bytes (default: 1MB)
+
+        Returns:
+            Checksum in format "blake3:abc123..."
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ImportError: If the blake3 package is not installed
+                        (error message includes install instructions)
+
+        Example:
+            >>> validator = FixtureValidator()
+            >>> checksum = validator.calculate_blake3("./fixtures/test/IRIS.DAT")
+            >>> checksum.startswith("blake3:")
+            True
+        """
+        try:
+            import blake3
+        except ImportError:
+            raise ImportError(
+                "BLAKE3 checksums require the 'blake3' package\n"
+                "\n"
+                "What went wrong:\n"
+                "  The optional blake3 dependency is not installed.\n"
+                "\n"
+                "How to fix it:\n"
+                "  1. Install it: pip install blake3\n"
+                "  2. Or use the default SHA256 checksum instead\n"
+            )
+
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            # Multi-threaded SIMD hashing straight off the page cache —
+            # blake3 memory-maps the file and fans out across cores.
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+        except (AttributeError, TypeError):
+            # Older blake3 bindings without mmap/threading support
+            hasher = blake3.blake3()
+            try:
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(chunk_size), b""):
+                        hasher.update(chunk)
+            except IOError as e:
+                raise IOError(f"Failed to read file {file_path}: {e}")
+
+        return f"blake3:{hasher.hexdigest()}"
+
     def validate_checksum(
         self, file_path: str, expected_checksum: str, chunk_size: int = 65536
     ) -> bool:
@@ -102,14 +333,18 @@ class FixtureValidator:
             ...     "sha256:abc123..."
             ... )
         """
-        if not expected_checksum.startswith("sha256:"):
+        if expected_checksum.startswith("sha256tree:"):
+            actual_checksum = self.calculate_sha256_tree(file_path)
+        elif expected_checksum.startswith("blake3:"):
+            actual_checksum = self.calculate_blake3(file_path)
+        elif expected_checksum.startswith("sha256:"):
+            actual_checksum = self.calculate_sha256(file_path, chunk_size)
+        else:
             raise ValueError(
                 f"Invalid checksum format: {expected_checksum}. "
-                "Must start with 'sha256:'"
+                "Must start with 'sha256:', 'sha256tree:' or 'blake3:'"
             )
 
-        actual_checksum = self.calculate_sha256(file_path, chunk_size)
-
         if actual_checksum != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum mismatch for {file_path}\n"
@@ -125,6 +360,52 @@ class FixtureValidator:
 
         return True
 
+    # Sidecar recording the last fully-validated state of IRIS.DAT
+    _VALIDATED_SIDECAR = ".iris_dat_validated.json"
+
+    def _fast_checksum_ok(self, dat_path: Path, expected_checksum: str) -> bool:
+        """
+        Check whether a prior full validation still covers this file.
+
+        Reads the sidecar written by _record_validated and compares
+        (size, mtime_ns, checksum) — two stat calls instead of hashing a
+        multi-GB file. Any mismatch or unreadable sidecar returns False so
+        the caller falls through to the full hash.
+        """
+        import json
+
+        sidecar = dat_path.parent / self._VALIDATED_SIDECAR
+        try:
+            data = json.loads(sidecar.read_text())
+            stat = dat_path.stat()
+            return (
+                data.get("checksum") == expected_checksum
+                and data.get("size") == stat.st_size
+                and data.get("mtime_ns") == stat.st_mtime_ns
+            )
+        except (OSError, ValueError):
+            return False
+
+    def _record_validated(self, dat_path: Path, checksum: str) -> None:
+        """Persist the validated (size, mtime_ns, checksum) sidecar."""
+        import json
+
+        sidecar = dat_path.parent / self._VALIDATED_SIDECAR
+        try:
+            stat = dat_path.stat()
+            sidecar.write_text(
+                json.dumps(
+                    {
+                        "checksum": checksum,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                    }
+                )
+            )
+        except OSError:
+            # Best-effort cache; validation already succeeded.
+            pass
+
     def validate_manifest(self, manifest: FixtureManifest) -> ValidationResult:
         """
         Validate manifest structure and contents (no file I/O).
@@ -147,7 +428,7 @@ class FixtureValidator:
     def validate_fixture(
         self,
         fixture_path: str,
-        validate_checksum: bool = True,
+        validate_checksum: Union[bool, str] = True,
         chunk_size: int = 65536,
     ) -> ValidationResult:
         """
@@ -155,7 +436,11 @@ class FixtureValidator:
 
         Args:
             fixture_path: Path to fixture directory
-            validate_checksum: Validate IRIS.DAT checksum (default: True, slower but safer)
+            validate_checksum: Validate IRIS.DAT checksum (default: True,
+                              slower but safer). Pass "auto" to skip the
+                              hash when size+mtime match the last fully
+                              validated state (sidecar-backed fast path;
+                              keep True for CI)
             chunk_size: Checksum chunk size in bytes (default: 64KB)
 
         Returns:
@@ -192,9 +477,10 @@ class FixtureValidator:
             errors.append("manifest.json not found")
             return ValidationResult(valid=False, errors=errors, warnings=warnings)
 
-        # Load and validate manifest structure
+        # Load and validate manifest structure (stat-keyed parse cache —
+        # the pytest plugin revalidates the same fixture once per test)
         try:
-            manifest = FixtureManifest.from_file(str(manifest_file))
+            manifest = _read_manifest(manifest_file)
             manifest_validation = self.validate_manifest(manifest)
             errors.extend(manifest_validation.errors)
             warnings.extend(manifest_validation.warnings)
@@ -210,11 +496,17 @@ class FixtureValidator:
             errors.append(f"{manifest.dat_file} is not a file")
         else:
             # Validate checksum if requested
-            if validate_checksum:
+            if validate_checksum == "auto" and self._fast_checksum_ok(
+                dat_file, manifest.checksum
+            ):
+                # Unchanged since last full validation — skip the hash.
+                pass
+            elif validate_checksum:
                 try:
                     self.validate_checksum(
                         str(dat_file), manifest.checksum, chunk_size
                     )
+                    self._record_validated(dat_file, manifest.checksum)
                 except ChecksumMismatchError:
                     # Re-raise ChecksumMismatchError - it's a critical failure
                     # that requires immediate attention (Constitutional Principle #5)
@@ -7,6 +7,8 @@ This package provides seamless integration with popular AI/ML frameworks:
 - More integrations coming soon!
 """
 
+from .embedding_index import EmbeddingIndex
 from .langchain import LangChainIRISContainer
+from .topk import topk_indices
 
-__all__ = ["LangChainIRISContainer"]
+__all__ = ["EmbeddingIndex", "LangChainIRISContainer", "topk_indices"]
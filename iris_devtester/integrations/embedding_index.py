@@ -0,0 +1,125 @@
+"""
+Packed float32 embedding index for Python-side similarity scans.
+
+Embeddings coming out of LangChain flow around as lists of Python floats
+— roughly 10x the memory bandwidth of the underlying values once boxing
+and list overhead are counted. EmbeddingIndex packs them into one
+contiguous (N, dim) float32 ndarray (structure-of-arrays) with rows
+normalized at insert time, so a query is a single BLAS matrix-vector
+product and cosine similarity reduces to a dot product — no
+per-document Python loop and no per-query renormalization.
+
+Pairs with topk_indices() for the selection step.
+
+Example:
+    >>> from iris_devtester.integrations.embedding_index import EmbeddingIndex
+    >>>
+    >>> index = EmbeddingIndex(dim=1536)
+    >>> index.add(embeddings.embed_documents(texts), ids=doc_ids)
+    >>> for doc_id, score in index.search(embeddings.embed_query(q), k=5):
+    ...     print(doc_id, score)
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .topk import topk_indices
+
+
+class EmbeddingIndex:
+    """
+    In-memory cosine-similarity index over packed float32 embeddings.
+
+    Vectors are stored as one C-contiguous (N, dim) float32 matrix with
+    unit-normalized rows; ids live in a parallel list. Not a replacement
+    for IRIS vector search — a scan buffer for tests and small corpora
+    where server round-trips dominate.
+    """
+
+    def __init__(self, dim: int):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Embedding dimensionality (e.g. 1536)
+        """
+        import numpy as np
+
+        self.dim = dim
+        self._mat = np.empty((0, dim), dtype=np.float32)
+        self._ids: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @staticmethod
+    def _normalize(mat: Any) -> Any:
+        """Unit-normalize rows in place-friendly float32 (zero rows kept)."""
+        import numpy as np
+
+        norms = np.linalg.norm(mat, axis=1, keepdims=True)
+        np.maximum(norms, np.finfo(np.float32).tiny, out=norms)
+        return mat / norms
+
+    def add(
+        self, vectors: Sequence[Sequence[float]], ids: Optional[Sequence[Any]] = None
+    ) -> None:
+        """
+        Add a batch of embeddings.
+
+        Args:
+            vectors: Iterable of embedding vectors (any float precision;
+                    converted to float32 in one pass)
+            ids: Optional parallel ids (defaults to running integers)
+
+        Raises:
+            ValueError: If vector dimensionality doesn't match the index
+        """
+        import numpy as np
+
+        batch = np.asarray(vectors, dtype=np.float32)
+        if batch.ndim == 1:
+            batch = batch.reshape(1, -1)
+        if batch.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected {self.dim}-dimensional vectors, got {batch.shape[1]}"
+            )
+
+        if ids is None:
+            ids = range(len(self._ids), len(self._ids) + batch.shape[0])
+        elif len(ids) != batch.shape[0]:
+            raise ValueError(
+                f"Got {batch.shape[0]} vectors but {len(ids)} ids"
+            )
+
+        # Normalize once at insert so every query is a bare dot product.
+        batch = np.ascontiguousarray(self._normalize(batch))
+        self._mat = np.concatenate([self._mat, batch], axis=0)
+        self._ids.extend(ids)
+
+    def search(
+        self, query: Sequence[float], k: int = 5
+    ) -> List[Tuple[Any, float]]:
+        """
+        Top-k most cosine-similar entries for a query embedding.
+
+        Args:
+            query: Query embedding vector
+            k: Number of results (clamped to index size)
+
+        Returns:
+            List of (id, similarity) pairs, best first
+        """
+        import numpy as np
+
+        if not self._ids:
+            return []
+
+        q = np.asarray(query, dtype=np.float32)
+        q_norm = np.linalg.norm(q)
+        if q_norm > 0:
+            q = q / q_norm
+
+        # One SIMD-friendly matrix-vector product over the packed rows.
+        sims = self._mat @ q
+        idx = topk_indices(sims, k)
+        return [(self._ids[i], float(sims[i])) for i in idx]
@@ -1,43 +1,74 @@
-"""Testing utilities and pytest fixtures for IRIS development."""
-
-from iris_devtester.testing.models import (
-    CleanupAction,
-    ColumnDefinition,
-    ContainerConfig,
-    IndexDefinition,
-    PasswordResetResult,
-    SchemaDefinition,
-    SchemaMismatch,
-    SchemaValidationResult,
-    TableDefinition,
-    TestState,
-)
-from iris_devtester.testing.schema_reset import (
-    SchemaResetter,
-    cleanup_test_data,
-    get_namespace_tables,
-    reset_namespace,
-    reset_schema,
-    verify_tables_exist,
-)
-
-__all__ = [
+"""Testing utilities and pytest fixtures for IRIS development.
+
+Attributes are loaded lazily (PEP 562): importing this package no longer
+pulls in the schema-reset machinery until a symbol is actually used,
+which keeps pytest collection and CLI startup fast.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from iris_devtester.testing.models import (
+        CleanupAction,
+        ColumnDefinition,
+        ContainerConfig,
+        IndexDefinition,
+        PasswordResetResult,
+        SchemaDefinition,
+        SchemaMismatch,
+        SchemaValidationResult,
+        TableDefinition,
+        TestState,
+    )
+    from iris_devtester.testing.schema_reset import (
+        SchemaResetter,
+        cleanup_test_data,
+        get_namespace_tables,
+        reset_namespace,
+        reset_schema,
+        verify_tables_exist,
+    )
+
+_MODELS = "iris_devtester.testing.models"
+_SCHEMA_RESET = "iris_devtester.testing.schema_reset"
+
+_MODULE_BY_ATTR = {
     # Models
-    "CleanupAction",
-    "ColumnDefinition",
-    "ContainerConfig",
-    "IndexDefinition",
-    "PasswordResetResult",
-    "SchemaDefinition",
-    "SchemaMismatch",
-    "SchemaValidationResult",
-    "TableDefinition",
-    "TestState",
+    "CleanupAction": _MODELS,
+    "ColumnDefinition": _MODELS,
+    "ContainerConfig": _MODELS,
+    "IndexDefinition": _MODELS,
+    "PasswordResetResult": _MODELS,
+    "SchemaDefinition": _MODELS,
+    "SchemaMismatch": _MODELS,
+    "SchemaValidationResult": _MODELS,
+    "TableDefinition": _MODELS,
+    "TestState": _MODELS,
     # Schema reset utilities
-    "SchemaResetter",
-    "cleanup_test_data",
-    "get_namespace_tables",
-    "reset_namespace",
-    "reset_schema",
-    "verify_tables_exist",
-]
+    "SchemaResetter": _SCHEMA_RESET,
+    "cleanup_test_data": _SCHEMA_RESET,
+    "get_namespace_tables": _SCHEMA_RESET,
+    "reset_namespace": _SCHEMA_RESET,
+    "reset_schema": _SCHEMA_RESET,
+    "verify_tables_exist": _SCHEMA_RESET,
+}
+
+__all__ = list(_MODULE_BY_ATTR)
+
+
+def __getattr__(name: str):
+    """Resolve public attributes on first access (PEP 562 lazy import)."""
+    module_name = _MODULE_BY_ATTR.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so subsequent lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -15,6 +15,53 @@ from typing import Any, List, Optional
 logger = logging.getLogger(__name__)
 
 
+# Attribute recording the namespace this module last switched a connection
+# to. Driver attributes like connection.namespace reflect the namespace the
+# connection was *opened* with and are not updated by setNamespace() or
+# 'SET NAMESPACE', so the fast path must consult our own record first.
+_ACTIVE_NS_ATTR = "_iris_devtester_active_namespace"
+
+
+def _ensure_namespace(connection: Any, namespace: str) -> None:
+    """
+    Switch a connection to a namespace without a SQL roundtrip when possible.
+
+    Connections opened with namespace=... (the loader/container default)
+    are already in the right namespace, so the check is attribute-only.
+    Drivers exposing a native setNamespace() get the connection-level
+    switch; only connections with neither fall back to the
+    'SET NAMESPACE' SQL statement. After a switch, the active namespace
+    is recorded on the connection so the fast path stays correct for
+    pooled connections that get switched and reused.
+
+    Args:
+        connection: Database connection (DBAPI or iris.connect())
+        namespace: Target namespace
+    """
+    current = getattr(connection, _ACTIVE_NS_ATTR, None)
+    if current is None:
+        current = getattr(connection, "namespace", None)
+    if current and str(current).upper() == namespace.upper():
+        return
+
+    setter = getattr(connection, "setNamespace", None)
+    if callable(setter):
+        setter(namespace)
+    else:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"SET NAMESPACE {namespace}")
+        finally:
+            cursor.close()
+
+    try:
+        setattr(connection, _ACTIVE_NS_ATTR, namespace)
+    except Exception:
+        # Connection objects that reject new attributes just lose the
+        # fast path — the next call performs a real switch again.
+        pass
+
+
 def reset_namespace(connection: Any, namespace: str) -> None:
     """
     Reset namespace to clean state by dropping all user tables.
@@ -41,12 +88,10 @@ def reset_namespace(connection: Any, namespace: str) -> None:
     See Also:
         - docs/learnings/rag-templates-production-patterns.md (Pattern 6)
     """
+    _ensure_namespace(connection, namespace)
     cursor = connection.cursor()
 
     try:
-        # Switch to namespace
-        cursor.execute(f"SET NAMESPACE {namespace}")
-
         # Get all user tables (excluding system tables)
         cursor.execute(
             """
@@ -96,11 +141,10 @@ def get_namespace_tables(connection: Any, namespace: str) -> List[str]:
         >>> tables = get_namespace_tables(conn, "USER")
         >>> print(f"Found {len(tables)} tables: {tables}")
     """
+    _ensure_namespace(connection, namespace)
     cursor = connection.cursor()
 
     try:
-        cursor.execute(f"SET NAMESPACE {namespace}")
-
         cursor.execute(
             """
             SELECT TABLE_NAME
@@ -26,9 +26,11 @@ Logging Levels:
 - DEBUG: Fallback attempts (modern → legacy)
 - ERROR: No package available
 """
+import functools
 import logging
 import time
 import importlib.metadata
+import importlib.util
 from dataclasses import dataclass
 from typing import Callable, Any
 from packaging import version
@@ -88,6 +90,17 @@ def validate_package_version(package_name: str, installed_version: str, min_vers
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _installed_version(distribution_name: str) -> str:
+    """Return the installed version for a distribution, cached.
+
+    importlib.metadata.version() re-scans dist-info metadata on every
+    call; the installed package set cannot change under a running
+    process, so one read per distribution is enough.
+    """
+    return importlib.metadata.version(distribution_name)
+
+
 class DBAPIPackageNotFoundError(ImportError):
     """Raised when no compatible IRIS Python package is found."""
 
@@ -122,6 +135,12 @@ def detect_dbapi_package() -> DBAPIPackageInfo:
     Tries modern package (intersystems-irispython) first, falls back to
     legacy package (intersystems-iris) if modern unavailable.
 
+    The result is cached for the lifetime of the module (the installed
+    package set can't change under a running process), so only the first
+    call pays the import probe and importlib.metadata work; repeats are
+    a dict lookup. Call detect_dbapi_package.cache_clear() to force
+    re-detection.
+
     Returns:
         DBAPIPackageInfo with detected package details
 
@@ -131,16 +150,33 @@ def detect_dbapi_package() -> DBAPIPackageInfo:
 
     Performance: <10ms detection time (NFR-001)
     """
+    return _detect_dbapi_package_impl()
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_dbapi_package_impl() -> DBAPIPackageInfo:
     start_time = time.perf_counter()
 
     # Try modern package first (priority per Principle #2)
     # CRITICAL: Use official iris.connect() API, NOT private _DBAPI attribute!
     # See CONSTITUTION.md Principle 8 for empirical evidence that _DBAPI does not exist.
     try:
-        import iris
         import os
         import sys
 
+        # Cheap presence check before the real import: find_spec() walks
+        # the meta_path finders without executing any module code, so a
+        # missing package is ruled out in microseconds instead of paying
+        # the import machinery's exception path. Skipped when the module
+        # is already loaded (then import is just a dict lookup, and an
+        # in-sys.modules entry without __spec__ would trip find_spec).
+        # When the package IS present we still import it below —
+        # connect_function and the ELSDK workaround need the live module.
+        if "iris" not in sys.modules and importlib.util.find_spec("iris") is None:
+            raise ImportError("intersystems-irispython not installed ('iris' module not found)")
+
+        import iris
+
         # Check if connect method is available
         if not hasattr(iris, "connect"):
             # Workaround for pytest module caching issue (from iris-vector-rag v0.5.13)
@@ -176,7 +212,7 @@ def detect_dbapi_package() -> DBAPIPackageInfo:
                     )
 
         # Validate version
-        pkg_version = importlib.metadata.version("intersystems-irispython")
+        pkg_version = _installed_version("intersystems-irispython")
         validate_package_version("intersystems-irispython", pkg_version, "5.1.2")
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -194,10 +230,21 @@ def detect_dbapi_package() -> DBAPIPackageInfo:
 
     # Fall back to legacy package
     try:
+        # Same no-execution guard as above (ModuleNotFoundError from a
+        # missing parent package is an ImportError subclass, so the
+        # except below handles both shapes).
+        import sys
+
+        if (
+            "iris.irissdk" not in sys.modules
+            and importlib.util.find_spec("iris.irissdk") is None
+        ):
+            raise ImportError("intersystems-iris not installed ('iris.irissdk' not found)")
+
         import iris.irissdk
 
         # Validate version
-        pkg_version = importlib.metadata.version("intersystems-iris")
+        pkg_version = _installed_version("intersystems-iris")
         validate_package_version("intersystems-iris", pkg_version, "3.0.0")
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -217,6 +264,11 @@ def detect_dbapi_package() -> DBAPIPackageInfo:
     raise DBAPIPackageNotFoundError()
 
 
+# Allow callers (and tests) to force a fresh probe after changing the
+# environment, mirroring the lru_cache API on the public name.
+detect_dbapi_package.cache_clear = _detect_dbapi_package_impl.cache_clear
+
+
 class DBAPIConnectionAdapter:
     """Adapter for IRIS DBAPI connections.
 
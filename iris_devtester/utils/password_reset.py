@@ -357,16 +357,12 @@ def reset_password(
         elif post_state.get("change_password") == 0:
             logger.debug(f"✓ Password state verified: ChangePassword=0, NeverExpires={post_state.get('never_expires')}")
 
-        # Feature 017: Reduced settle delay now that we use correct API (PasswordExternal)
-        # The old 12s delay was needed when using the wrong API (Password property).
-        # With PasswordExternal + ChangePassword=0, changes propagate in ~1-2s.
-        if platform.system() == "Darwin":
-            settle_delay = 2.0
-            logger.debug(
-                f"macOS detected: waiting {settle_delay}s for IRIS security "
-                f"metadata propagation"
-            )
-            time.sleep(settle_delay)
+        # No fixed settle delay (previously 2s on macOS, 12s before Feature
+        # 017): the verification loop below IS the active readiness probe —
+        # it attempts a real connection immediately and backs off only when
+        # IRIS reports the password isn't live yet. Fast systems proceed in
+        # one attempt; slow macOS Docker Desktop setups pay exactly the
+        # propagation time instead of a worst-case constant.
 
         # Step 3: Verify password via connection with retry + exponential backoff
         logger.debug("Starting password verification with connection attempt...")
@@ -6,99 +6,593 @@ Provides IRIS database connections and containers for integration testing.
 
 import logging
 import os
+import pathlib
+import platform
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from iris_devtester.containers import IRISContainer
+
+# docker, iris_devtester.connections.pool, IRISContainer and
+# reset_namespace are imported lazily inside the fixtures that need
+# them: this conftest loads for every run (including `pytest -m unit`
+# and IDE --collect-only passes), and the docker/testcontainers stack
+# costs a few hundred ms of import time that unit-only runs shouldn't
+# pay.
 
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture(scope="function")
-def iris_db(request):
-    import uuid
-    test_name = request.node.name.replace("[", "_").replace("]", "_")
-    container_id = str(uuid.uuid4())[:8]
-    name = f"iris_test_{test_name}_{container_id}"
+def pytest_addoption(parser):
+    """Add iris-devtester test-run options."""
+    parser.addoption(
+        "--isolated-container",
+        action="store_true",
+        default=False,
+        help=(
+            "Give every test its own IRIS container (pre-session-reuse "
+            "behavior). Slower; implied for tests marked 'destructive'."
+        ),
+    )
+    parser.addoption(
+        "--iris-keepalive",
+        action="store_true",
+        default=False,
+        help=(
+            "Reuse (and leave running) a single '%s' container across "
+            "pytest runs, so iterative TDD loops skip container startup "
+            "entirely. Remove it with: docker rm -f %s"
+            % ("iris-devtest-keepalive", "iris-devtest-keepalive")
+        ),
+    )
 
-    with IRISContainer.community(
-        username="test",
-        password="test"
-    ) as iris:
-        iris._name = name
-        conn = iris.get_connection()
 
-        def execute_objectscript(code):
-            result = iris.exec(
-                ["iris", "session", "IRIS", "-U", "USER", code]
-            )
-            return result.output.decode() if result.output else ""
+def _load_license_key():
+    """Resolve the Enterprise license key from env or ./iris.key, or None."""
+    key = os.environ.get("IRIS_LICENSE_KEY")
+    if key:
+        return key
+    key_file = pathlib.Path(__file__).parent.parent / "iris.key"
+    if key_file.exists():
+        return key_file.read_text().strip()
+    return None
+
+
+# Resolved once at conftest load: the key is constant for the whole run,
+# so per-test fixtures shouldn't re-stat and re-read iris.key each time.
+_IRIS_LICENSE_KEY = _load_license_key()
+
+
+def _enterprise_image():
+    """Pick the Enterprise image tag, or None when no license is available."""
+    if not _IRIS_LICENSE_KEY:
+        return None
+    if platform.machine() in ("arm64", "aarch64"):
+        return "containers.intersystems.com/intersystems/iris-arm64:2025.1"
+    return "intersystemsdc/iris:latest"
+
+
+_docker = None  # Lazily-created shared DockerClient (see _shared_docker_client)
+
+
+def _shared_docker_client():
+    """Return one process-wide DockerClient, creating it on first use.
 
-        conn.execute_objectscript = execute_objectscript
-        conn._container = iris
+    docker.from_env() re-reads the environment, re-probes the daemon
+    socket, and builds a fresh requests session with its own connection
+    pool on every call — previously paid in every fixture teardown.
+    Sharing one client keeps the unix-socket connections pooled across
+    fixtures (max_pool_size sized for concurrent container probes).
+    """
+    import docker
+
+    global _docker
+    if _docker is None:
+        _docker = docker.from_env(max_pool_size=16)
+    return _docker
+
+
+@pytest.fixture(scope="session")
+def _docker_client():
+    """Session-scoped shared docker client, closed at session end."""
+    client = _shared_docker_client()
+    yield client
+    global _docker
+    _docker = None
+    client.close()
+
+
+_image_pulls = []  # Futures started after collection, awaited by the fixture
+
+# Fixtures whose use implies an IRIS container (and hence an image pull).
+_CONTAINER_FIXTURES = frozenset(
+    {
+        "iris_db",
+        "iris_db_tx",
+        "iris_db_fresh",
+        "iris_db_shared",
+        "iris_container",
+        "iris_db_both_editions",
+        "_iris_session_container",
+    }
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Kick off IRIS image pulls when the collected tests will need them.
+
+    Every container fixture otherwise pays its own registry round-trip
+    (and on a cold docker cache, a full pull) inside the first test that
+    uses it. Starting the pulls here — Community, plus Enterprise when a
+    license key is present — lets them overlap the remaining setup;
+    _prewarm_images joins them before the first test. Failures are
+    ignored: the container start retries the pull and reports real
+    errors with proper context.
 
+    The pulls only start when a collected item actually uses a container
+    fixture, so unit-only runs (and --collect-only passes) never touch
+    the docker stack, let alone block on multi-GB downloads.
+    """
+    if config.getoption("--collect-only"):
+        return
+    if not any(
+        _CONTAINER_FIXTURES.intersection(getattr(item, "fixturenames", ()))
+        for item in items
+    ):
+        return
+    try:
+        client = _shared_docker_client()
+    except Exception:
+        return
+
+    tags = ["intersystemsdc/iris-community:latest"]
+    enterprise = _enterprise_image()
+    if enterprise:
+        tags.append(enterprise)
+
+    def _pull(tag):
         try:
-            yield conn
-        finally:
-            if conn:
+            client.images.pull(tag)
+        except Exception:
+            pass  # Container start will surface real pull failures
+
+    def _reap_stale_containers():
+        # Aborted runs can leave exited iris_test_* containers behind,
+        # which accumulate and slow the docker daemon. Only non-running
+        # ones are removed — running containers may belong to another
+        # concurrent xdist worker.
+        try:
+            stale = client.containers.list(
+                all=True, filters={"name": "iris_test_", "status": "exited"}
+            )
+            for container in stale:
                 try:
-                    conn.close()
+                    container.remove(force=True)
                 except Exception:
                     pass
+        except Exception:
+            pass
+
+    executor = ThreadPoolExecutor(max_workers=3)
+    _image_pulls.extend(executor.submit(_pull, tag) for tag in tags)
+    _image_pulls.append(executor.submit(_reap_stale_containers))
+    executor.shutdown(wait=False)
+
 
-    # Container cleanup handled by IRISContainer context manager
+@pytest.fixture(scope="session", autouse=True)
+def _prewarm_images():
+    """Wait for the post-collection image pulls before the first test.
+
+    No-op (empty futures list) when no collected test uses a container
+    fixture — see pytest_collection_modifyitems.
+    """
+    for future in _image_pulls:
+        try:
+            future.result()
+        except Exception:
+            pass
+    yield
+
+
+class _PersistentObjectScriptSession:
+    """One long-lived `iris session` per container, fed over an exec socket.
+
+    The old execute_objectscript helper ran a fresh docker exec per call,
+    and each exec forks a shell and boots a new IRIS terminal process
+    (hundreds of ms of VM init) to run one snippet. Keeping a single
+    session open and writing snippets to its stdin amortizes that boot
+    across every call in the test; a sentinel write marks completion so
+    reads don't block. Any socket hiccup falls back to the one-shot exec.
+    """
+
+    _SENTINEL = "__IRIS_DEVTESTER_DONE__"
+
+    def __init__(self, iris):
+        self._iris = iris
+        self._sock = None
+
+    def _ensure_socket(self):
+        if self._sock is None:
+            client = _shared_docker_client()
+            container_id = self._iris.get_wrapped_container().id
+            exec_id = client.api.exec_create(
+                container_id,
+                ["iris", "session", "IRIS", "-U", "USER"],
+                stdin=True,
+                tty=True,
+            )["Id"]
+            self._sock = client.api.exec_start(exec_id, socket=True, tty=True)
+            self._sock._sock.settimeout(30)
+        return self._sock
+
+    def execute(self, code):
+        """Run an ObjectScript snippet, returning its terminal output."""
+        try:
+            sock = self._ensure_socket()
+            payload = (
+                code.rstrip("\n") + "\n" + f'write "{self._SENTINEL}",!\n'
+            )
+            sock._sock.sendall(payload.encode())
+            sentinel = self._SENTINEL.encode()
+            # Accumulate chunks in a bytearray and decode once at the end:
+            # bytes += reallocates and copies the whole buffer per chunk
+            # (quadratic for verbose output, e.g. a schema install dumping
+            # hundreds of lines), while extend() amortizes to linear. Only
+            # the unscanned tail is searched for the sentinel each time.
+            buf = bytearray()
+            seen = 0
+            scan_from = 0
+            # Two sentinel hits: the tty echoes the write statement itself,
+            # then the session prints the sentinel once the code has run.
+            while seen < 2:
+                chunk = sock._sock.recv(4096)
+                if not chunk:
+                    raise ConnectionError("iris session exec closed")
+                buf.extend(chunk)
+                seen += buf.count(sentinel, scan_from)
+                scan_from = max(0, len(buf) - len(sentinel) + 1)
+            output = buf.decode(errors="replace")
+            return output[: output.rfind(self._SENTINEL)]
+        except Exception:
+            # Session died (or never started) — retire it and fall back
+            # to the slow-but-reliable one-shot exec for this call.
+            self.close()
+            result = self._iris.exec(
+                ["iris", "session", "IRIS", "-U", "USER", code]
+            )
+            return result.output.decode() if result.output else ""
+
+    def close(self):
+        if self._sock is None:
+            return
+        try:
+            self._sock._sock.sendall(b"HALT\n")
+        except Exception:
+            pass
+        try:
+            self._sock.close()
+        except Exception:
+            pass
+        self._sock = None
+
+
+# One ObjectScript session per container object: tests sharing a container
+# then share a single booted iris session for the container's lifetime
+# instead of booting one per test.
+_os_sessions = {}
+
+
+def _attach_helpers(conn, iris):
+    """Wire the container-backed helpers tests expect onto a connection."""
+    session = _os_sessions.get(id(iris))
+    if session is None:
+        session = _os_sessions[id(iris)] = _PersistentObjectScriptSession(iris)
+    conn.execute_objectscript = session.execute
+    conn._objectscript_session = session
+    conn._container = iris
+    return conn
+
+
+def _close_helper_session(conn):
+    """Tear down the persistent ObjectScript session attached to a conn.
+
+    Call only when the backing container is going away — sessions are
+    shared per container, so closing mid-session would force the next
+    test to pay a fresh IRIS session boot.
+    """
+    session = getattr(conn, "_objectscript_session", None)
+    if session is not None:
+        session.close()
+        _os_sessions.pop(id(conn._container), None)
+
+
+# Stable name for the --iris-keepalive container. Deliberately outside
+# the iris_test_* namespace so the stale-container reaper never touches it.
+_KEEPALIVE_NAME = "iris-devtest-keepalive"
+
+
+def _keepalive_enabled(config):
+    """True when container keepalive was requested via flag or env.
+
+    The IRIS_DEVTESTER_KEEPALIVE env var covers invocations where adding
+    pytest flags is awkward (IDE runners, tox); CI stays ephemeral unless
+    it opts in explicitly.
+    """
+    if config.getoption("--iris-keepalive"):
+        return True
+    return os.environ.get("IRIS_DEVTESTER_KEEPALIVE", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def _retire_objectscript_session(iris):
+    """Close and drop the container's shared ObjectScript session, if any."""
+    session = _os_sessions.pop(id(iris), None)
+    if session is not None:
+        session.close()
+
+
+def _keepalive_session_container(request):
+    """Attach to (or start) the cross-run keepalive container.
+
+    With --iris-keepalive the container is never stopped: the first run
+    pays the boot, every later run attaches to the still-running
+    container in well under a second. State still gets the usual
+    between-test namespace reset; anything that survives that is the
+    user's to clean up (docker rm -f iris-devtest-keepalive).
+    """
+    from iris_devtester.containers import IRISContainer
+
+    existing = []
+    try:
+        existing = _shared_docker_client().containers.list(
+            filters={"name": _KEEPALIVE_NAME, "status": "running"}
+        )
+    except Exception:
+        pass
 
-    # CRITICAL: Wait for container to be fully removed before next test
-    # This prevents test isolation issues where test 2 connects to test 1's container
+    if existing:
+        iris = IRISContainer.attach(_KEEPALIVE_NAME)
+        # attach() assumes docker-compose defaults (SuperUser/SYS); this
+        # container was started by a previous keepalive run with the
+        # standard test credentials.
+        iris._config.username = "test"
+        iris._config.password = "test"
+        # The container may still be booting (e.g. started seconds ago by
+        # a parallel run); wait_for_ready is a fast no-op once IRIS is up.
+        try:
+            iris.wait_for_ready(timeout=60)
+        except Exception:
+            logger.warning(
+                "Keepalive container '%s' not ready; tests may fail "
+                "(docker rm -f %s to start fresh)",
+                _KEEPALIVE_NAME,
+                _KEEPALIVE_NAME,
+            )
+    else:
+        container = IRISContainer.community(username="test", password="test")
+        container._name = _KEEPALIVE_NAME
+        iris = container.start()  # no stop at teardown — that's the point
+
+    # The container outlives the session, but this process's ObjectScript
+    # session socket does not — retire it so the next run starts clean.
+    request.addfinalizer(lambda: _retire_objectscript_session(iris))
+    return iris
+
+
+@pytest.fixture(scope="session")
+def _iris_session_container(request):
+    """One IRIS container for the whole session.
+
+    Container startup (image check, docker run, health wait, CallIn
+    enable) dominates per-test cost; paying it once and isolating tests
+    by wiping user tables between them removes (N-1) container boots.
+
+    Under pytest-xdist each worker process gets its own session scope, so
+    this is naturally one container per worker (M tests -> N containers
+    for N workers); the worker id goes into the container name so
+    concurrent workers never collide and `docker ps` maps back to them.
+
+    With --iris-keepalive the container additionally survives across
+    pytest runs (see _keepalive_session_container).
+
+    Teardown is registered via request.addfinalizer as it becomes due
+    (container started, connections pooled), so cleanup runs LIFO and
+    still fires when a later setup step or the test body is interrupted.
+    """
+    if _keepalive_enabled(request.config):
+        return _keepalive_session_container(request)
+
+    from iris_devtester.connections import pool
+    from iris_devtester.containers import IRISContainer
+
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    container = IRISContainer.community(username="test", password="test")
+    container._name = f"iris_test_{worker_id}_{str(uuid.uuid4())[:8]}"
+    iris = container.start()
+    request.addfinalizer(container.stop)
+
+    def _drain():
+        # The container is going away: retire its shared ObjectScript
+        # session and drop any idle pooled connections so later acquires
+        # can't get a dead socket.
+        _retire_objectscript_session(iris)
+        config = iris.get_config()
+        pool.evict_for_host(config.host, config.port)
+
+    request.addfinalizer(_drain)  # LIFO: drain before the stop above
+    return iris
+
+
+def _isolated_iris_db(request):
+    """Original per-test container path, kept for destructive tests."""
+    from iris_devtester.containers import IRISContainer
+
+    test_name = request.node.name.replace("[", "_").replace("]", "_")
+    container_id = str(uuid.uuid4())[:8]
+
+    container = IRISContainer.community(username="test", password="test")
+    container._name = f"iris_test_{test_name}_{container_id}"
+    iris = container.start()
+    # LIFO from here: close conn/session, stop container, wait for removal.
+    request.addfinalizer(lambda: _wait_container_removed(iris))
+    request.addfinalizer(container.stop)
+
+    conn = _attach_helpers(iris.get_connection(), iris)
+
+    def _close():
+        _close_helper_session(conn)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    request.addfinalizer(_close)
+    return conn
+
+
+def _wait_container_removed(iris, timeout=10):
+    """Block until the container is fully removed (isolation guarantee).
+
+    Uses the daemon's blocking wait(condition="removed") instead of a
+    1s-interval poll, so we unblock the moment the removal completes
+    rather than on the next poll tick.
+    """
     import docker
+
     try:
-        client = docker.from_env()
-        # Wait up to 10 seconds for container to be fully removed
-        for _ in range(10):
-            try:
-                client.containers.get(iris.get_wrapped_container().id)
-                time.sleep(1)  # Container still exists, wait
-            except docker.errors.NotFound:
-                break  # Container removed, we're done
+        client = _shared_docker_client()
+        container_id = iris.get_wrapped_container().id
+        try:
+            client.api.wait(container_id, condition="removed", timeout=timeout)
+        except docker.errors.NotFound:
+            pass  # Already removed — nothing to wait for
     except Exception:
         pass  # Ignore docker errors during cleanup verification
 
 
+@pytest.fixture(scope="function")
+def iris_db(request):
+    # Destructive tests (and --isolated-container runs) still get a
+    # throwaway container; everything else shares the session container
+    # and resets state between tests.
+    if request.config.getoption("--isolated-container") or request.node.get_closest_marker(
+        "destructive"
+    ):
+        return _isolated_iris_db(request)
+
+    from iris_devtester.connections import pool
+    from iris_devtester.testing import reset_namespace
+
+    iris = request.getfixturevalue("_iris_session_container")
+    # First call does the one-time warmup (CallIn, password hardening)
+    # and is cached on the container; per-test connections then come from
+    # the pool, skipping the TCP+auth handshake after the first test.
+    iris.get_connection()
+    conn = _attach_helpers(pool.acquire(iris.get_config()), iris)
+
+    def _reset_and_release():
+        # Per-test isolation on the shared container: drop whatever user
+        # tables the test created instead of rebuilding the container.
+        try:
+            reset_namespace(conn, "USER")
+        except Exception:
+            logger.warning("Post-test namespace reset failed", exc_info=True)
+        # Keep the ObjectScript session open — it is shared per container
+        # and retired with the session container's teardown.
+        pool.release(conn)
+
+    request.addfinalizer(_reset_and_release)
+    return conn
+
+
+@pytest.fixture(scope="function")
+def iris_db_tx(request, iris_db):
+    """iris_db wrapped in a transaction that is rolled back after the test.
+
+    For tests whose writes are all transactional, rollback is cheaper
+    than the namespace reset iris_db performs — the reset then finds
+    nothing to drop. Tests mutating non-transactional state (configs,
+    monitoring tasks) should stay on iris_db or iris_db_fresh.
+    """
+    cursor = iris_db.cursor()
+    cursor.execute("START TRANSACTION")
+
+    def _rollback():
+        try:
+            iris_db.rollback()
+        except Exception:
+            logger.warning("Post-test rollback failed", exc_info=True)
+
+    request.addfinalizer(_rollback)
+    return iris_db
+
+
+@pytest.fixture(scope="function")
+def iris_db_fresh(request):
+    """A throwaway per-test container, regardless of run options.
+
+    The escape hatch for tests that mutate container-level state the
+    shared-container reset can't undo (equivalent to marking the test
+    'destructive').
+    """
+    return _isolated_iris_db(request)
+
+
 @pytest.fixture(scope="module")
-def iris_db_shared():
-    with IRISContainer.community(
-        username="test",
-        password="test"
-    ) as iris:
-        conn = iris.get_connection()
-
-        def execute_objectscript(code):
-            result = iris.exec(
-                ["iris", "session", "IRIS", "-U", "USER", code]
-            )
-            return result.output.decode() if result.output else ""
+def iris_db_shared(request):
+    # Rides the worker's singleton container, but in a namespace of its
+    # own: module-scoped tables must not leak into later modules on the
+    # same worker, and the per-test USER resets that iris_db teardowns
+    # perform must not drop them mid-module. Namespace and connection are
+    # torn down with the module; the ObjectScript session stays open —
+    # it is shared per container.
+    import dataclasses
+
+    from iris_devtester.connections import get_connection
 
-        conn.execute_objectscript = execute_objectscript
-        conn._container = iris
+    iris = request.getfixturevalue("_iris_session_container")
+    iris.get_connection()  # one-time container warmup (CallIn, users)
+    namespace = iris.get_test_namespace(prefix="SHARED")
+    request.addfinalizer(lambda: iris.delete_namespace(namespace))
 
+    conn = get_connection(
+        dataclasses.replace(iris.get_config(), namespace=namespace)
+    )
+
+    def _close():
         try:
-            yield conn
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
+            conn.close()
+        except Exception:
+            pass
+
+    request.addfinalizer(_close)  # LIFO: close conn before namespace delete
+    return _attach_helpers(conn, iris)
 
 
 @pytest.fixture(scope="function")
-def iris_container():
-    with IRISContainer.community() as iris:
-        yield iris
+def iris_container(request):
+    # Same singleton-per-worker reuse as iris_db: only --isolated-container
+    # runs and 'destructive' tests pay for their own container boot.
+    if request.config.getoption("--isolated-container") or request.node.get_closest_marker(
+        "destructive"
+    ):
+        from iris_devtester.containers import IRISContainer
+
+        container = IRISContainer.community()
+        iris = container.start()
+        request.addfinalizer(container.stop)
+        return iris
+
+    return request.getfixturevalue("_iris_session_container")
 
 
 @pytest.fixture(scope="function", params=["community", "enterprise"])
 def iris_db_both_editions(request):
-    import uuid
-    import os
+    from iris_devtester.containers import IRISContainer
+
     edition = request.param
     test_name = request.node.name.replace("[", "_").replace("]", "_")
     container_id = str(uuid.uuid4())[:8]
@@ -107,53 +601,30 @@ def iris_db_both_editions(request):
     if edition == "community":
         iris_container = IRISContainer.community(username="test", password="test")
     else:
-        license_key = os.environ.get("IRIS_LICENSE_KEY")
-        if not license_key:
-            import pathlib
-            key_file = pathlib.Path(__file__).parent.parent / "iris.key"
-            if key_file.exists():
-                license_key = key_file.read_text().strip()
-        if not license_key:
+        if not _IRIS_LICENSE_KEY:
             pytest.skip("IRIS_LICENSE_KEY not set")
-        iris_container = IRISContainer.enterprise(license_key=license_key, username="SuperUser", password="SYS")
+        iris_container = IRISContainer.enterprise(
+            license_key=_IRIS_LICENSE_KEY, username="SuperUser", password="SYS"
+        )
 
     iris_container._name = name
-    with iris_container as iris:
-        conn = iris.get_connection()
-
-        def execute_objectscript(code):
-            result = iris.exec(
-                ["iris", "session", "IRIS", "-U", "USER", code]
-            )
-            return result.output.decode() if result.output else ""
+    iris = iris_container.start()
+    # LIFO from here: close conn/session, stop container, wait for removal.
+    request.addfinalizer(lambda: _wait_container_removed(iris))
+    request.addfinalizer(iris_container.stop)
 
-        conn.execute_objectscript = execute_objectscript
-        conn._container = iris
-        conn._edition = edition
+    conn = _attach_helpers(iris.get_connection(), iris)
+    conn._edition = edition
 
+    def _close():
+        _close_helper_session(conn)
         try:
-            yield conn
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
-    # Container cleanup handled by IRISContainer context manager
+            conn.close()
+        except Exception:
+            pass
 
-    # CRITICAL: Wait for container to be fully removed before next test
-    import docker
-    try:
-        client = docker.from_env()
-        # Wait up to 10 seconds for container to be fully removed
-        for _ in range(10):
-            try:
-                client.containers.get(iris.get_wrapped_container().id)
-                time.sleep(1)  # Container still exists, wait
-            except docker.errors.NotFound:
-                break  # Container removed, we're done
-    except Exception:
-        pass  # Ignore docker errors during cleanup verification
+    request.addfinalizer(_close)
+    return conn
 
 
 # Configure pytest markers
@@ -171,3 +642,7 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "enterprise: mark test as requiring Enterprise edition (needs IRIS_LICENSE_KEY)"
     )
+    config.addinivalue_line(
+        "markers",
+        "destructive: mark test as mutating container/server state (always gets an isolated container)",
+    )
@@ -119,3 +119,32 @@ def iris_objectscript_connection(iris_container, test_namespace):
     yield conn
 
     conn.close()
+
+
+# Minimum number of performance benchmarks expected in
+# test_fixture_performance.py. Checked at collection time instead of as a
+# dir()-reflection test, so drift is caught without spending a test run
+# (and new classes count automatically, which the reflection missed).
+EXPECTED_PERF_TEST_COUNT = 6
+
+
+def pytest_collection_modifyitems(config, items):
+    perf_items = [i for i in items if "test_fixture_performance" in i.nodeid]
+    # Only enforce when the perf module was actually collected — running
+    # another subset of the suite must not trip the check.
+    if not perf_items:
+        return
+    # Narrowed selections (a node-id with ::, -k, -m, --deselect) collect
+    # fewer perf items on purpose; only a whole-module collection is a
+    # meaningful drift signal.
+    if config.option.keyword or config.option.markexpr:
+        return
+    if getattr(config.option, "deselect", None):
+        return
+    if any("::" in arg for arg in config.args):
+        return
+    if len(perf_items) < EXPECTED_PERF_TEST_COUNT:
+        raise pytest.UsageError(
+            f"Expected at least {EXPECTED_PERF_TEST_COUNT} performance "
+            f"tests in test_fixture_performance.py, found {len(perf_items)}"
+        )
@@ -69,10 +69,12 @@ class TestFixtureRoundtrip:
             )
         """)
 
-        # Insert test rows
-        cursor.execute("INSERT INTO TestData (ID, Name, Value) VALUES (1, 'Alice', 100.50)")
-        cursor.execute("INSERT INTO TestData (ID, Name, Value) VALUES (2, 'Bob', 200.75)")
-        cursor.execute("INSERT INTO TestData (ID, Name, Value) VALUES (3, 'Charlie', 300.25)")
+        # Insert test rows — one parameterized statement (single cached
+        # SQL plan) instead of three literal variants
+        cursor.executemany(
+            "INSERT INTO TestData (ID, Name, Value) VALUES (?, ?, ?)",
+            [(1, "Alice", 100.50), (2, "Bob", 200.75), (3, "Charlie", 300.25)],
+        )
 
         cursor.close()
 
@@ -10,7 +10,6 @@ Constitutional Compliance:
 """
 
 import pytest
-from iris_devtester.containers import IRISContainer
 from iris_devtester.fixtures import (
     export_classes,
     import_classes,
@@ -22,21 +21,18 @@ from iris_devtester.fixtures import (
 )
 
 
-@pytest.fixture(scope="module")
-def running_iris_container():
-    """Running IRIS container for export/import tests."""
-    with IRISContainer.community() as iris:
-        iris.wait_for_ready(timeout=60)
-        yield iris
+# These tests use the session-scoped `iris_container` fixture from
+# conftest.py (already wait_for_ready-ed there), rather than paying a
+# full container startup for this module alone.
 
 
 class TestExportClasses:
     """Test export_classes() function."""
 
-    def test_export_returns_result(self, running_iris_container):
+    def test_export_returns_result(self, iris_container):
         """Export should return ExportResult object."""
         result = export_classes(
-            running_iris_container,
+            iris_container,
             namespace="%SYS",
             pattern="Security.Users.cls",
             output_file="/tmp/test-export.xml",
@@ -45,10 +41,10 @@ class TestExportClasses:
         assert isinstance(result, ExportResult)
         assert result.output_file == "/tmp/test-export.xml"
 
-    def test_export_system_class_succeeds(self, running_iris_container):
+    def test_export_system_class_succeeds(self, iris_container):
         """Exporting a system class should succeed."""
         result = export_classes(
-            running_iris_container,
+            iris_container,
             namespace="%SYS",
             pattern="%SYSTEM.OBJ.cls",
             output_file="/tmp/system-obj.xml",
@@ -61,12 +57,12 @@ class TestExportClasses:
 class TestImportClasses:
     """Test import_classes() function."""
 
-    def test_import_returns_result(self, running_iris_container):
+    def test_import_returns_result(self, iris_container):
         """Import should return ImportResult object."""
         # Note: IRIS $SYSTEM.OBJ.Load() silently succeeds even for nonexistent files
         # with 0 items imported. This is expected IRIS behavior.
         result = import_classes(
-            running_iris_container,
+            iris_container,
             namespace="USER",
             input_file="/tmp/nonexistent.xml",
             compile=False,
@@ -80,10 +76,10 @@ class TestImportClasses:
 class TestExportGlobal:
     """Test export_global() function."""
 
-    def test_export_returns_result(self, running_iris_container):
+    def test_export_returns_result(self, iris_container):
         """Export global should return ExportResult object."""
         result = export_global(
-            running_iris_container,
+            iris_container,
             namespace="USER",
             global_name="^TestGlobal",
             output_file="/tmp/test-global.gof",
@@ -95,12 +91,12 @@ class TestExportGlobal:
 class TestImportGlobal:
     """Test import_global() function."""
 
-    def test_import_returns_result(self, running_iris_container):
+    def test_import_returns_result(self, iris_container):
         """Import global should return ImportResult object."""
         # Note: IRIS %Global.Import silently succeeds for nonexistent files
         # with varying item counts. This is expected IRIS behavior.
         result = import_global(
-            running_iris_container,
+            iris_container,
             namespace="USER",
             input_file="/tmp/nonexistent.gof",
         )
@@ -114,10 +110,10 @@ class TestImportGlobal:
 class TestExportPackage:
     """Test export_package() function."""
 
-    def test_export_returns_result(self, running_iris_container):
+    def test_export_returns_result(self, iris_container):
         """Export package should return ExportResult object."""
         result = export_package(
-            running_iris_container,
+            iris_container,
             namespace="%SYS",
             package_name="Security",
             output_file="/tmp/security-pkg.xml",
@@ -129,7 +125,7 @@ class TestExportPackage:
 class TestExportImportRoundTrip:
     """Test round-trip export and import."""
 
-    def test_export_import_roundtrip_pattern(self, running_iris_container):
+    def test_export_import_roundtrip_pattern(self, iris_container):
         """Pattern: Export from one namespace, import to another.
 
         This tests the documented pattern from iris-backup-patterns.md:
@@ -138,21 +134,24 @@ class TestExportImportRoundTrip:
         """
         # Export a system class (guaranteed to exist)
         export_result = export_classes(
-            running_iris_container,
+            iris_container,
             namespace="%SYS",
             pattern="%Utility.cls",
             output_file="/tmp/utility-class.xml",
         )
 
-        # If export succeeded, try import
-        if export_result.success:
-            import_result = import_classes(
-                running_iris_container,
-                namespace="USER",
-                input_file="/tmp/utility-class.xml",
-                compile=False,  # Don't compile system classes in USER
-            )
-
-            # Verify result structure
-            assert isinstance(import_result, ImportResult)
-            assert import_result.message  # Should have some message
+        # An export failure is a missing precondition, not a pass: skip
+        # explicitly instead of silently reporting a do-nothing success.
+        if not export_result.success:
+            pytest.skip(f"Export precondition failed: {export_result.message}")
+
+        import_result = import_classes(
+            iris_container,
+            namespace="USER",
+            input_file="/tmp/utility-class.xml",
+            compile=False,  # Don't compile system classes in USER
+        )
+
+        # Verify result structure
+        assert isinstance(import_result, ImportResult)
+        assert import_result.message  # Should have some message
@@ -9,12 +9,14 @@ Tests verify that fixture operations meet performance targets:
 Note: These are integration tests requiring a live IRIS instance.
 """
 
+import json
 import pytest
-import tempfile
-import shutil
+import os
 import time
 from pathlib import Path
 
+from filelock import FileLock
+
 from iris_devtester.fixtures import (
     FixtureCreator,
     DATFixtureLoader,
@@ -29,46 +31,134 @@ from iris_devtester.connections import get_connection
 # - test_namespace (function scope)
 
 
-@pytest.fixture(scope="function")
-def temp_dir():
-    """Provide temporary directory for fixtures."""
-    temp_dir = tempfile.mkdtemp(prefix="perf_test_")
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+@pytest.fixture(scope="session")
+def checksum_timings_file(tmp_path_factory):
+    """Path to the JSON file collecting checksum-load timings.
+
+    Under pytest-xdist each worker gets its own basetemp; the parent
+    directory is shared by all workers of the run, so placing the file
+    there lets the two parametrized load variants record their timings
+    from whichever workers they land on. Writes go through a FileLock.
+    """
+    root = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent
+    return root / "checksum_load_timings.json"
+
+
+def _record_timing(timings_file, key, elapsed):
+    """Record one load timing under ``key``, serialized via FileLock."""
+    with FileLock(str(timings_file) + ".lock"):
+        timings = _read_timings(timings_file)
+        timings[key] = elapsed
+        timings_file.write_text(json.dumps(timings))
+
+
+def _read_timings(timings_file):
+    """Read the recorded timings, returning {} if absent or unreadable."""
+    try:
+        return json.loads(timings_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+@pytest.fixture(scope="module")
+def temp_dir(tmp_path_factory):
+    """Provide a shared temporary directory for fixtures.
+
+    Module-scoped and backed by tmp_path_factory: every test writes to a
+    distinct path underneath it, so one mkdir serves the whole module and
+    pytest's basetemp rotation handles cleanup instead of a synchronous
+    rmtree between tests.
+    """
+    return str(tmp_path_factory.mktemp("perf"))
+
+
+def _seeded_namespace(iris_container, prefix, create_sql, table, rows):
+    """Create a namespace and populate one table, yielding the namespace.
+
+    Shared setup for the module-scoped source namespaces below: the
+    benchmarks only read from their source, so seeding once per module
+    keeps the (formerly per-test) namespace-create and insert loop out
+    of every benchmark's timing and off the suite's critical path.
+
+    Seeding goes through a single DBAPI ``executemany`` batch rather than
+    per-row INSERT statements — one prepared statement reused for every
+    row instead of 10,000 individually parsed and dispatched statements,
+    so the seed phase stays sub-second and the NFR budgets measure only
+    the code under test.
+    """
+    import dataclasses
+
+    namespace = iris_container.get_test_namespace(prefix=prefix)
+    config = iris_container.get_config()
+    conn = get_connection(dataclasses.replace(config, namespace=namespace))
+    try:
+        cursor = conn.cursor()
+        cursor.execute(create_sql)
+        placeholders = ", ".join("?" for _ in rows[0])
+        cursor.executemany(
+            f"INSERT INTO {table} VALUES ({placeholders})", rows
+        )
+        cursor.close()
+    finally:
+        try:
+            conn.close()
+        except Exception:
+            pass
 
+    yield namespace
 
-class TestFixtureCreationPerformance:
-    """Test fixture creation performance (NFR-001)."""
-
-    def test_create_fixture_10k_rows_under_30s(self, iris_container, test_namespace, iris_connection, temp_dir):
-        """Test creating fixture with 10K rows completes in <30 seconds."""
-        # Use test_namespace from fixture
-        source_namespace = test_namespace
-        cursor = iris_connection.cursor()
+    iris_container.delete_namespace(namespace)
 
-        # Drop table if it exists (cleanup from previous test failures)
-        try:
-            cursor.execute("DROP TABLE PerfTestData")
-        except Exception:
-            pass  # Table doesn't exist, that's fine
 
-        # Create table using SQL (DBAPI, 3x faster)
-        cursor.execute("""
+@pytest.fixture(scope="module")
+def seeded_namespace_10k(iris_container):
+    """Module-scoped source namespace holding a 10K-row PerfTestData table."""
+    yield from _seeded_namespace(
+        iris_container,
+        prefix="PERF10K",
+        create_sql="""
             CREATE TABLE PerfTestData (
                 ID INT PRIMARY KEY,
                 Name VARCHAR(100),
                 Value DECIMAL(10,2),
                 Description VARCHAR(500)
             )
-        """)
-
-        # Insert 10K rows using SQL (batch insert for performance)
-        for i in range(1, 10001):
-            cursor.execute(
-                "INSERT INTO PerfTestData (ID, Name, Value, Description) VALUES (?, ?, ?, ?)",
-                (i, f"Name_{i}", i * 1.5, f"Description for row {i}")
+        """,
+        table="PerfTestData",
+        rows=[
+            (i, f"Name_{i}", i * 1.5, f"Description for row {i}")
+            for i in range(1, 10001)
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def seeded_namespace_small(iris_container):
+    """Module-scoped source namespace holding a 100-row SmallTestData table."""
+    yield from _seeded_namespace(
+        iris_container,
+        prefix="PERFSMALL",
+        create_sql="""
+            CREATE TABLE SmallTestData (
+                ID INT PRIMARY KEY,
+                Name VARCHAR(100)
             )
-        cursor.close()
+        """,
+        table="SmallTestData",
+        rows=[(i, f"Name_{i}") for i in range(1, 101)],
+    )
+
+
+class TestFixtureCreationPerformance:
+    """Test fixture creation performance (NFR-001)."""
+
+    def test_create_fixture_10k_rows_under_30s(self, iris_container, seeded_namespace_10k, temp_dir):
+        """Test creating fixture with 10K rows completes in <30 seconds."""
+        # Module-scoped source namespace: the 10K-row seed is built once,
+        # so only the creation under test is timed here.
+        source_namespace = seeded_namespace_10k
 
         # Measure creation time
         fixture_path = Path(temp_dir) / "perf-10k"
@@ -92,27 +182,9 @@ class TestFixtureCreationPerformance:
         assert table_info is not None
         assert table_info.row_count == 10000
 
-    def test_create_small_fixture_under_5s(self, iris_container, test_namespace, iris_connection, temp_dir):
+    def test_create_small_fixture_under_5s(self, iris_container, seeded_namespace_small, temp_dir):
         """Test creating small fixture (<1K rows) completes in <5 seconds."""
-        # Use test_namespace from fixture
-        source_namespace = test_namespace
-        cursor = iris_connection.cursor()
-
-        # Create table with 100 rows using SQL
-        cursor.execute("""
-            CREATE TABLE SmallTestData (
-                ID INT PRIMARY KEY,
-                Name VARCHAR(100)
-            )
-        """)
-
-        # Insert 100 rows
-        for i in range(1, 101):
-            cursor.execute(
-                "INSERT INTO SmallTestData (ID, Name) VALUES (?, ?)",
-                (i, f"Name_{i}")
-            )
-        cursor.close()
+        source_namespace = seeded_namespace_small
 
         # Measure creation time
         fixture_path = Path(temp_dir) / "perf-small"
@@ -132,53 +204,33 @@ class TestFixtureCreationPerformance:
 class TestFixtureLoadingPerformance:
     """Test fixture loading performance (NFR-002)."""
 
-    @pytest.mark.slow
-    def test_load_fixture_10k_rows_under_10s(self, iris_container, test_namespace, iris_connection, temp_dir):
-        """Test loading fixture with 10K rows completes in <10 seconds."""
-        # Use test_namespace provided by fixture (already created)
-        source_namespace = test_namespace
-
-        # Create test data in source namespace
-        cursor = iris_connection.cursor()
-
-        # Drop table if it exists (cleanup from previous test failures)
-        try:
-            cursor.execute("DROP TABLE PerfTestData")
-        except Exception:
-            pass  # Table doesn't exist, that's fine
-
-        cursor.execute("""
-            CREATE TABLE PerfTestData (
-                ID INT PRIMARY KEY,
-                Name VARCHAR(100),
-                Value DECIMAL(10,2)
-            )
-        """)
-
-        # Insert 10K rows
-        for i in range(10000):
-            cursor.execute(
-                "INSERT INTO PerfTestData (ID, Name, Value) VALUES (?, ?, ?)",
-                (i, f"Name_{i}", i * 1.5)
-            )
-        cursor.close()
+    @pytest.fixture(scope="class")
+    def fixture_10k_path(self, iris_container, seeded_namespace_10k, tmp_path_factory):
+        """Create the 10K-row .DAT fixture once for the whole class.
 
-        # Create fixture from source namespace
-        fixture_path = Path(temp_dir) / "load-perf"
+        Both loading benchmarks only read the created fixture, so a
+        single create_fixture() here (instead of one per test) halves
+        the class's IRIS setup work. Only load_fixture() is timed.
+        """
+        fixture_path = tmp_path_factory.mktemp("load_perf") / "load-perf"
         creator = FixtureCreator(container=iris_container)
         creator.create_fixture(
             fixture_id="load-perf",
-            namespace=source_namespace,
+            namespace=seeded_namespace_10k,
             output_dir=str(fixture_path)
         )
+        return fixture_path
 
+    @pytest.mark.slow
+    def test_load_fixture_10k_rows_under_10s(self, iris_container, fixture_10k_path):
+        """Test loading fixture with 10K rows completes in <10 seconds."""
         # Measure load time
         loader = DATFixtureLoader(container=iris_container)
         target_namespace = iris_container.get_test_namespace(prefix="LOAD_PERF_TARGET")
 
         start_time = time.time()
         result = loader.load_fixture(
-            fixture_path=str(fixture_path),
+            fixture_path=str(fixture_10k_path),
             target_namespace=target_namespace,
             validate_checksum=True
         )
@@ -193,80 +245,77 @@ class TestFixtureLoadingPerformance:
         except Exception:
             pass  # Ignore cleanup errors
 
-    @pytest.mark.skip(reason="Flaky test - checksum performance difference unmeasurable on small (1-row) fixtures. Namespace creation overhead dominates timing. Test passes on large fixtures (10K+ rows) where checksum overhead is significant.")
-    def test_load_without_checksum_faster(self, iris_container, test_namespace, iris_connection, temp_dir):
-        """Test that skipping checksum validation speeds up loading."""
-        # Use test_namespace provided by fixture
-        source_namespace = test_namespace
-
-        # Create a small table for the fixture (need at least one table for valid manifest)
-        cursor = iris_connection.cursor()
-        cursor.execute("""
-            CREATE TABLE ChecksumTest (
-                ID INT PRIMARY KEY,
-                Name VARCHAR(50)
-            )
-        """)
-        cursor.execute("INSERT INTO ChecksumTest (ID, Name) VALUES (1, 'test')")
-        cursor.close()
-
-        # Create fixture
-        fixture_path = Path(temp_dir) / "checksum-perf"
-        creator = FixtureCreator(container=iris_container)
-        creator.create_fixture(
-            fixture_id="checksum-perf",
-            namespace=source_namespace,
-            output_dir=str(fixture_path)
-        )
-
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "validate_checksum",
+        [True, False],
+        ids=["with-checksum", "without-checksum"],
+    )
+    def test_load_without_checksum_faster(
+        self, iris_container, fixture_10k_path, checksum_timings_file, validate_checksum
+    ):
+        """Time one fixture load per checksum mode.
+
+        Parametrized so the two loads are independent test items: under
+        pytest-xdist they fan out to separate workers instead of running
+        back-to-back, and each variant records its elapsed time to the
+        shared timings file for the ratio test below.
+
+        Previously skipped as flaky: on a 1-row fixture the checksum
+        delta was unmeasurable against namespace-creation noise. The
+        shared 10K-row fixture is large enough for the checksum cost
+        to register, which is the regime the skip reason called out.
+        """
         loader = DATFixtureLoader(container=iris_container)
+        label = "WITH" if validate_checksum else "WITHOUT"
+        target_namespace = iris_container.get_test_namespace(prefix=f"CHECKSUM_{label}")
 
-        # Load with checksum validation
-        namespace_with = iris_container.get_test_namespace(prefix="CHECKSUM_WITH")
-        start_with = time.time()
-        result_with = loader.load_fixture(
-            fixture_path=str(fixture_path),
-            target_namespace=namespace_with,
-            validate_checksum=True
-        )
-        elapsed_with = time.time() - start_with
-
-        # Load without checksum validation
-        namespace_without = iris_container.get_test_namespace(prefix="CHECKSUM_WITHOUT")
-        start_without = time.time()
-        result_without = loader.load_fixture(
-            fixture_path=str(fixture_path),
-            target_namespace=namespace_without,
-            validate_checksum=False
+        start_time = time.time()
+        result = loader.load_fixture(
+            fixture_path=str(fixture_10k_path),
+            target_namespace=target_namespace,
+            validate_checksum=validate_checksum
         )
-        elapsed_without = time.time() - start_without
+        elapsed = time.time() - start_time
 
-        assert result_with.success
-        assert result_without.success
+        assert result.success
 
-        # Loading without checksum should be faster (or at least not slower)
-        assert elapsed_without <= elapsed_with * 1.1  # Allow 10% margin
+        _record_timing(
+            checksum_timings_file,
+            "with" if validate_checksum else "without",
+            elapsed,
+        )
 
-        # Cleanup namespaces (use actual namespace names from get_test_namespace)
-        try:
-            loader.cleanup_fixture(namespace_with, delete_namespace=True)
-        except Exception:
-            pass  # Ignore cleanup errors
+        # Cleanup target namespace
         try:
-            loader.cleanup_fixture(namespace_without, delete_namespace=True)
+            loader.cleanup_fixture(target_namespace, delete_namespace=True)
         except Exception:
             pass  # Ignore cleanup errors
 
+    def test_load_without_checksum_ratio(self, checksum_timings_file):
+        """Assert the checksum-free load was not slower, once both ran.
+
+        Skips when either timing is missing — e.g. a variant was
+        deselected, or an xdist worker has not reached it yet.
+        """
+        timings = _read_timings(checksum_timings_file)
+        if "with" not in timings or "without" not in timings:
+            pytest.skip("Both checksum-load variants must record timings first")
+
+        # Loading without checksum should be faster (or at least not slower)
+        assert timings["without"] <= timings["with"] * 1.1  # Allow 10% margin
+
 
 class TestFixtureValidationPerformance:
     """Test fixture validation performance (NFR-003)."""
 
-    def test_validate_fixture_under_5s(self, iris_container, test_namespace, temp_dir):
+    def test_validate_fixture_under_5s(self, iris_container, seeded_namespace_small, temp_dir):
         """Test fixture validation completes in <5 seconds."""
-        # Use test_namespace provided by fixture (already created)
-        source_namespace = test_namespace
+        # Any populated source works here — validation timing is what's
+        # under test, so ride the module-scoped small namespace.
+        source_namespace = seeded_namespace_small
 
-        # Create fixture from source namespace (empty is fine for validation performance test)
+        # Create fixture from source namespace
         fixture_path = Path(temp_dir) / "validate-perf"
         creator = FixtureCreator(container=iris_container)
         creator.create_fixture(
@@ -297,9 +346,15 @@ class TestChecksumPerformance:
         # Create a test file (simulate IRIS.DAT size)
         test_file = Path(temp_dir) / "test.dat"
 
-        # Create 10MB file
+        # Allocate a 10MB file without writing 10MB of data: the write
+        # I/O is orthogonal to the SHA256 being benchmarked, and sparse
+        # reads deterministically return zeros.
+        size = 10 * 1024 * 1024
         with open(test_file, 'wb') as f:
-            f.write(b'0' * (10 * 1024 * 1024))
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, size)
+            else:
+                f.truncate(size)
 
         # Measure checksum time
         validator = FixtureValidator()
@@ -310,25 +365,3 @@ class TestChecksumPerformance:
 
         assert checksum.startswith("sha256:")
         assert elapsed < 2.0, f"Checksum took {elapsed:.2f}s, expected <2s for 10MB file"
-
-
-# Test count verification
-def test_performance_test_count():
-    """Verify we have comprehensive performance tests."""
-    import sys
-    module = sys.modules[__name__]
-
-    test_classes = [
-        TestFixtureCreationPerformance,
-        TestFixtureLoadingPerformance,
-        TestFixtureValidationPerformance,
-        TestChecksumPerformance,
-    ]
-
-    total_tests = 0
-    for test_class in test_classes:
-        test_methods = [m for m in dir(test_class) if m.startswith('test_')]
-        total_tests += len(test_methods)
-
-    # Should have at least 6 performance tests
-    assert total_tests >= 6, f"Expected at least 6 performance tests, found {total_tests}"
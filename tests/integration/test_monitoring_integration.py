@@ -23,6 +23,7 @@ from iris_devtester.containers.monitoring import (
     suspend_task,
     resume_task,
     delete_task,
+    delete_tasks,
     list_monitoring_tasks,
     TaskSchedule,
 )
@@ -104,13 +105,17 @@ def iris_conn(monitoring_container):
         except:
             pass
 
-        # Delete all monitoring tasks created during test
+        # Delete all monitoring tasks created during test (one batch)
         try:
             tasks = list_monitoring_tasks(conn)
-            for task in tasks:
-                if "task_id" in task:
+            task_ids = [t["task_id"] for t in tasks if "task_id" in t]
+            try:
+                delete_tasks(conn, task_ids)
+            except:
+                # Batch failed — fall back to one-by-one to clean what we can
+                for task_id in task_ids:
                     try:
-                        delete_task(conn, task["task_id"])
+                        delete_task(conn, task_id)
                     except:
                         pass
         except:
@@ -360,9 +365,8 @@ class TestTaskManagerIntegration:
             assert "task_class" in task
             assert task["task_class"] == "%SYS.Task.SystemPerformance"
 
-        # Clean up
-        delete_task(iris_conn, task_id1)
-        delete_task(iris_conn, task_id2)
+        # Clean up (single batched round-trip)
+        delete_tasks(iris_conn, [task_id1, task_id2])
 
 
 class TestResourceMonitoringIntegration:
@@ -17,6 +17,11 @@ Tests verify:
 import pytest
 from iris_devtester.utils.password_reset import reset_password
 
+# destructive: these tests rewrite the container's credentials, which a
+# between-test namespace reset cannot undo — each test gets its own
+# container instead of the shared per-worker one.
+pytestmark = pytest.mark.destructive
+
 
 class TestResetPasswordIntegration:
     """Integration tests for reset_password() function."""
@@ -3,6 +3,9 @@ import subprocess
 from iris_devtester.utils.password_reset import reset_password
 
 @pytest.mark.integration
+# destructive: rewrites the container's credentials, which the shared
+# per-worker container cannot absorb — this test gets its own container.
+@pytest.mark.destructive
 def test_password_reset_clears_flag_reliably(iris_container):
     container_name = iris_container.get_wrapped_container().name
     config = iris_container.get_config()
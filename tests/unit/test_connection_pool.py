@@ -0,0 +1,107 @@
+"""Unit tests for the connection pool (iris_devtester.connections.pool)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from iris_devtester.config import IRISConfig
+from iris_devtester.connections import pool
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    """Each test starts and ends with an empty pool."""
+    pool.clear()
+    yield
+    pool.clear()
+
+
+def make_config(**overrides):
+    defaults = dict(host="localhost", port=1972, namespace="USER", username="test")
+    defaults.update(overrides)
+    return IRISConfig(**defaults)
+
+
+def make_conn(alive=True):
+    conn = MagicMock()
+    if not alive:
+        conn.cursor.side_effect = Exception("dead socket")
+    return conn
+
+
+def test_acquire_opens_fresh_connection_when_pool_empty():
+    config = make_config()
+    fresh = make_conn()
+    with patch.object(pool, "get_connection", return_value=fresh) as mock_get:
+        conn = pool.acquire(config)
+
+    assert conn is fresh
+    mock_get.assert_called_once_with(config)
+
+
+def test_release_then_acquire_reuses_connection():
+    config = make_config()
+    fresh = make_conn()
+    with patch.object(pool, "get_connection", return_value=fresh):
+        conn = pool.acquire(config)
+
+    pool.release(conn)
+
+    with patch.object(pool, "get_connection") as mock_get:
+        again = pool.acquire(config)
+
+    assert again is conn
+    mock_get.assert_not_called()
+    conn.close.assert_not_called()
+
+
+def test_acquire_discards_dead_pooled_connection():
+    config = make_config()
+    dead = make_conn(alive=False)
+    with patch.object(pool, "get_connection", return_value=dead):
+        conn = pool.acquire(config)
+    pool.release(conn)
+
+    fresh = make_conn()
+    with patch.object(pool, "get_connection", return_value=fresh) as mock_get:
+        replacement = pool.acquire(config)
+
+    assert replacement is fresh
+    mock_get.assert_called_once()
+    dead.close.assert_called_once()
+
+
+def test_pools_are_keyed_by_connection_target():
+    config_a = make_config(namespace="USER")
+    config_b = make_config(namespace="OTHER")
+    conn_a = make_conn()
+    with patch.object(pool, "get_connection", return_value=conn_a):
+        pool.release(pool.acquire(config_a))
+
+    conn_b = make_conn()
+    with patch.object(pool, "get_connection", return_value=conn_b) as mock_get:
+        acquired = pool.acquire(config_b)
+
+    assert acquired is conn_b
+    mock_get.assert_called_once()
+
+
+def test_evict_for_host_closes_idle_connections():
+    config = make_config()
+    conn = make_conn()
+    with patch.object(pool, "get_connection", return_value=conn):
+        pool.release(pool.acquire(config))
+
+    pool.evict_for_host(config.host, config.port)
+
+    conn.close.assert_called_once()
+    fresh = make_conn()
+    with patch.object(pool, "get_connection", return_value=fresh) as mock_get:
+        assert pool.acquire(config) is fresh
+    mock_get.assert_called_once()
+
+
+def test_release_without_pool_key_closes_connection():
+    orphan = make_conn()
+    pool.release(orphan)
+    orphan.close.assert_called_once()
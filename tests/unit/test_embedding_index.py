@@ -0,0 +1,54 @@
+"""Unit tests for EmbeddingIndex (iris_devtester.integrations.embedding_index)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from iris_devtester.integrations.embedding_index import EmbeddingIndex
+
+
+def test_stores_packed_float32_matrix():
+    index = EmbeddingIndex(dim=4)
+    index.add([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+
+    assert index._mat.dtype == np.float32
+    assert index._mat.shape == (2, 4)
+    assert index._mat.flags["C_CONTIGUOUS"]
+    assert len(index) == 2
+
+
+def test_rows_normalized_at_insert():
+    index = EmbeddingIndex(dim=3)
+    index.add([[3.0, 0.0, 4.0]])
+    np.testing.assert_allclose(
+        np.linalg.norm(index._mat, axis=1), [1.0], rtol=1e-6
+    )
+
+
+def test_search_returns_most_similar_first():
+    index = EmbeddingIndex(dim=3)
+    index.add(
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]],
+        ids=["x", "y", "xy"],
+    )
+
+    results = index.search([1.0, 0.1, 0.0], k=2)
+
+    assert [doc_id for doc_id, _ in results] == ["x", "xy"]
+    assert results[0][1] > results[1][1]
+
+
+def test_search_on_empty_index_returns_empty():
+    assert EmbeddingIndex(dim=8).search([0.0] * 8, k=3) == []
+
+
+def test_dimension_mismatch_raises():
+    index = EmbeddingIndex(dim=4)
+    with pytest.raises(ValueError, match="4-dimensional"):
+        index.add([[1.0, 2.0]])
+
+
+def test_ids_length_mismatch_raises():
+    index = EmbeddingIndex(dim=2)
+    with pytest.raises(ValueError, match="ids"):
+        index.add([[1.0, 0.0]], ids=["a", "b"])
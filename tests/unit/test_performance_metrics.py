@@ -11,6 +11,10 @@ from datetime import datetime
 from iris_devtester.containers.performance import PerformanceMetrics
 from iris_devtester.containers.monitoring import ResourceThresholds
 
+# Defaults-only thresholds are immutable reads in every test below, so one
+# shared instance replaces a per-test dataclass construction + validation.
+DEFAULT_THRESHOLDS = ResourceThresholds()
+
 
 class TestPerformanceMetricsCreation:
     """Test PerformanceMetrics dataclass creation."""
@@ -149,7 +153,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=True,
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.exceeds_thresholds(thresholds) is True
 
     def test_exceeds_thresholds_when_memory_high(self):
@@ -165,7 +169,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=True,
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.exceeds_thresholds(thresholds) is True
 
     def test_exceeds_thresholds_when_both_high(self):
@@ -181,7 +185,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=True,
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.exceeds_thresholds(thresholds) is True
 
     def test_does_not_exceed_thresholds_when_normal(self):
@@ -197,7 +201,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=True,
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.exceeds_thresholds(thresholds) is False
 
     def test_below_thresholds_when_resources_recovered(self):
@@ -213,7 +217,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=False,  # Currently disabled
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.below_thresholds(thresholds) is True
 
     def test_not_below_thresholds_when_cpu_still_high(self):
@@ -229,7 +233,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=False,
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.below_thresholds(thresholds) is False
 
     def test_not_below_thresholds_when_memory_still_high(self):
@@ -245,7 +249,7 @@ class TestPerformanceMetricsThresholdChecking:
             monitoring_enabled=False,
         )
 
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
         assert metrics.below_thresholds(thresholds) is False
 
 
@@ -268,7 +272,7 @@ class TestPerformanceMetricsRealisticScenarios:
         metrics = PerformanceMetrics.from_objectscript_result(
             json_result, monitoring_enabled=True
         )
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
 
         # Should not trigger disable
         assert metrics.exceeds_thresholds(thresholds) is False
@@ -291,7 +295,7 @@ class TestPerformanceMetricsRealisticScenarios:
         metrics = PerformanceMetrics.from_objectscript_result(
             json_result, monitoring_enabled=True
         )
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
 
         # Should trigger disable
         assert metrics.exceeds_thresholds(thresholds) is True
@@ -312,7 +316,7 @@ class TestPerformanceMetricsRealisticScenarios:
         metrics = PerformanceMetrics.from_objectscript_result(
             json_result, monitoring_enabled=True
         )
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
 
         # Should trigger disable
         assert metrics.exceeds_thresholds(thresholds) is True
@@ -333,7 +337,7 @@ class TestPerformanceMetricsRealisticScenarios:
         metrics = PerformanceMetrics.from_objectscript_result(
             json_result, monitoring_enabled=False  # Currently disabled
         )
-        thresholds = ResourceThresholds()
+        thresholds = DEFAULT_THRESHOLDS
 
         # Should allow re-enable
         assert metrics.below_thresholds(thresholds) is True
@@ -341,6 +345,58 @@ class TestPerformanceMetricsRealisticScenarios:
         assert metrics.exceeds_thresholds(thresholds) is False
 
 
+class TestPerformanceMetricsBatchScoring:
+    """Test batch_exceeds() and batch_below() classmethods."""
+
+    @staticmethod
+    def _metrics(cpu, memory, enabled=True):
+        return PerformanceMetrics(
+            timestamp=datetime.now(),
+            cpu_percent=cpu,
+            memory_percent=memory,
+            global_references=0,
+            lock_requests=0,
+            disk_reads=0,
+            disk_writes=0,
+            monitoring_enabled=enabled,
+        )
+
+    def test_batch_exceeds_matches_per_sample_results(self):
+        """Batch scoring agrees with exceeds_thresholds() per sample."""
+        samples = [
+            self._metrics(95.0, 60.0),  # CPU spike
+            self._metrics(60.0, 98.0),  # Memory pressure
+            self._metrics(50.0, 60.0),  # Healthy
+        ]
+
+        results = PerformanceMetrics.batch_exceeds(samples, DEFAULT_THRESHOLDS)
+
+        assert results == [
+            m.exceeds_thresholds(DEFAULT_THRESHOLDS) for m in samples
+        ]
+        assert results == [True, True, False]
+
+    def test_batch_below_matches_per_sample_results(self):
+        """Batch scoring agrees with below_thresholds() per sample."""
+        samples = [
+            self._metrics(80.0, 85.0, enabled=False),  # Recovered
+            self._metrics(88.0, 85.0, enabled=False),  # CPU still high
+            self._metrics(80.0, 92.0, enabled=False),  # Memory still high
+        ]
+
+        results = PerformanceMetrics.batch_below(samples, DEFAULT_THRESHOLDS)
+
+        assert results == [
+            m.below_thresholds(DEFAULT_THRESHOLDS) for m in samples
+        ]
+        assert results == [True, False, False]
+
+    def test_batch_scoring_empty_list(self):
+        """Empty history buffers score to empty results."""
+        assert PerformanceMetrics.batch_exceeds([], DEFAULT_THRESHOLDS) == []
+        assert PerformanceMetrics.batch_below([], DEFAULT_THRESHOLDS) == []
+
+
 class TestPerformanceMetricsCustomThresholds:
     """Test metrics work with custom thresholds (FR-023)."""
 
@@ -353,7 +409,7 @@ class TestPerformanceMetricsCustomThresholds:
         )
 
         # Default thresholds (90%, 95%) - should not disable
-        default_thresholds = ResourceThresholds()
+        default_thresholds = DEFAULT_THRESHOLDS
         assert metrics.exceeds_thresholds(default_thresholds) is False
 
         # Aggressive thresholds (70%, 75%) - should disable
@@ -371,7 +427,7 @@ class TestPerformanceMetricsCustomThresholds:
         )
 
         # Default thresholds (90%, 95%) - should disable
-        default_thresholds = ResourceThresholds()
+        default_thresholds = DEFAULT_THRESHOLDS
         assert metrics.exceeds_thresholds(default_thresholds) is True
 
         # Conservative thresholds (98%, 99%) - should not disable
@@ -9,12 +9,23 @@ import pytest
 from iris_devtester.containers.monitoring import ResourceThresholds
 
 
+@pytest.fixture(scope="module")
+def default_thresholds():
+    """One default ResourceThresholds shared across the module.
+
+    The dataclass is immutable in practice (tests only call its pure
+    predicates), so constructing it once avoids per-test dataclass
+    __init__ churn.
+    """
+    return ResourceThresholds()
+
+
 class TestResourceThresholdsDefaults:
     """Test default values follow FR-017, FR-018."""
 
-    def test_default_thresholds_match_specification(self):
+    def test_default_thresholds_match_specification(self, default_thresholds):
         """Test defaults match spec (CPU 90%, memory 95%)."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # FR-017: Auto-disable thresholds
         assert thresholds.cpu_disable_percent == 90.0
@@ -27,12 +38,20 @@ class TestResourceThresholdsDefaults:
         # Check interval
         assert thresholds.check_interval_seconds == 60
 
-    def test_default_thresholds_validate(self):
+    def test_default_thresholds_validate(self, default_thresholds):
         """Test default thresholds pass validation."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
         # Should not raise
         thresholds.validate()
 
+    def test_default_classmethod_returns_cached_instance(self):
+        """Test default() returns one shared, pre-validated instance."""
+        first = ResourceThresholds.default()
+        second = ResourceThresholds.default()
+
+        assert first is second
+        assert first == ResourceThresholds()
+
 
 class TestResourceThresholdsValidation:
     """Test validation logic following Constitutional Principle #5: Fail Fast with Guidance."""
@@ -131,36 +150,36 @@ class TestResourceThresholdsValidation:
 class TestResourceThresholdsDisableLogic:
     """Test should_disable() logic for FR-017."""
 
-    def test_cpu_exceeds_threshold_triggers_disable(self):
+    def test_cpu_exceeds_threshold_triggers_disable(self, default_thresholds):
         """Test CPU > 90% triggers disable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # CPU at 95% (exceeds 90%)
         assert thresholds.should_disable(cpu_percent=95.0, memory_percent=50.0) is True
 
-    def test_memory_exceeds_threshold_triggers_disable(self):
+    def test_memory_exceeds_threshold_triggers_disable(self, default_thresholds):
         """Test memory > 95% triggers disable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Memory at 98% (exceeds 95%)
         assert thresholds.should_disable(cpu_percent=50.0, memory_percent=98.0) is True
 
-    def test_both_exceed_thresholds_triggers_disable(self):
+    def test_both_exceed_thresholds_triggers_disable(self, default_thresholds):
         """Test both CPU and memory exceeding triggers disable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         assert thresholds.should_disable(cpu_percent=95.0, memory_percent=98.0) is True
 
-    def test_below_thresholds_does_not_trigger_disable(self):
+    def test_below_thresholds_does_not_trigger_disable(self, default_thresholds):
         """Test normal levels don't trigger disable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Both below thresholds
         assert thresholds.should_disable(cpu_percent=50.0, memory_percent=60.0) is False
 
-    def test_exactly_at_threshold_does_not_trigger_disable(self):
+    def test_exactly_at_threshold_does_not_trigger_disable(self, default_thresholds):
         """Test exactly at threshold doesn't trigger (> not >=)."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Exactly at thresholds
         assert thresholds.should_disable(cpu_percent=90.0, memory_percent=95.0) is False
@@ -181,36 +200,36 @@ class TestResourceThresholdsDisableLogic:
 class TestResourceThresholdsEnableLogic:
     """Test should_enable() logic for FR-018 with hysteresis."""
 
-    def test_both_below_enable_thresholds_allows_enable(self):
+    def test_both_below_enable_thresholds_allows_enable(self, default_thresholds):
         """Test CPU < 85% AND memory < 90% allows re-enable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Both below enable thresholds
         assert thresholds.should_enable(cpu_percent=80.0, memory_percent=85.0) is True
 
-    def test_cpu_above_enable_threshold_prevents_enable(self):
+    def test_cpu_above_enable_threshold_prevents_enable(self, default_thresholds):
         """Test CPU >= 85% prevents re-enable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # CPU at 90%, memory OK
         assert thresholds.should_enable(cpu_percent=90.0, memory_percent=85.0) is False
 
-    def test_memory_above_enable_threshold_prevents_enable(self):
+    def test_memory_above_enable_threshold_prevents_enable(self, default_thresholds):
         """Test memory >= 90% prevents re-enable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Memory at 92%, CPU OK
         assert thresholds.should_enable(cpu_percent=80.0, memory_percent=92.0) is False
 
-    def test_both_above_enable_thresholds_prevents_enable(self):
+    def test_both_above_enable_thresholds_prevents_enable(self, default_thresholds):
         """Test both above prevents re-enable."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         assert thresholds.should_enable(cpu_percent=88.0, memory_percent=93.0) is False
 
-    def test_exactly_at_enable_threshold_prevents_enable(self):
+    def test_exactly_at_enable_threshold_prevents_enable(self, default_thresholds):
         """Test exactly at threshold prevents enable (< not <=)."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Exactly at enable thresholds
         assert thresholds.should_enable(cpu_percent=85.0, memory_percent=90.0) is False
@@ -234,9 +253,9 @@ class TestResourceThresholdsEnableLogic:
 class TestResourceThresholdsHysteresis:
     """Test hysteresis prevents thrashing (FR-018)."""
 
-    def test_hysteresis_gap_prevents_immediate_re_enable(self):
+    def test_hysteresis_gap_prevents_immediate_re_enable(self, default_thresholds):
         """Test 5% gap prevents oscillation."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # CPU at 92% - should disable
         assert thresholds.should_disable(cpu_percent=92.0, memory_percent=80.0) is True
@@ -247,9 +266,9 @@ class TestResourceThresholdsHysteresis:
         # CPU drops to 82% - now can re-enable
         assert thresholds.should_enable(cpu_percent=82.0, memory_percent=80.0) is True
 
-    def test_scenario_disable_to_enable_cycle(self):
+    def test_scenario_disable_to_enable_cycle(self, default_thresholds):
         """Test realistic disable → enable cycle with hysteresis."""
-        thresholds = ResourceThresholds()
+        thresholds = default_thresholds
 
         # Normal operation (monitoring active)
         assert thresholds.should_disable(cpu_percent=70.0, memory_percent=80.0) is False
@@ -0,0 +1,37 @@
+"""Unit tests for top-k selection (iris_devtester.integrations.topk)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from iris_devtester.integrations.topk import topk_indices
+
+
+def test_returns_highest_scores_first():
+    scores = np.array([0.1, 0.9, 0.3, 0.7, 0.5], dtype=np.float32)
+    idx = topk_indices(scores, 3)
+    assert list(idx) == [1, 3, 4]
+
+
+def test_matches_full_sort_on_random_input():
+    rng = np.random.default_rng(42)
+    scores = rng.random(1000).astype(np.float32)
+    idx = topk_indices(scores, 10)
+    expected = np.argsort(-scores)[:10]
+    assert list(idx) == list(expected)
+
+
+def test_k_larger_than_input_returns_all_sorted():
+    scores = np.array([0.2, 0.8, 0.5], dtype=np.float32)
+    idx = topk_indices(scores, 10)
+    assert list(idx) == [1, 2, 0]
+
+
+def test_k_zero_returns_empty():
+    scores = np.array([0.2, 0.8], dtype=np.float32)
+    assert topk_indices(scores, 0).size == 0
+
+
+def test_accepts_plain_python_list():
+    idx = topk_indices([0.1, 0.4, 0.2], 2)
+    assert list(idx) == [1, 2]